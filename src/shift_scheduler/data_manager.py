@@ -5,14 +5,69 @@ Handles all file I/O operations, JSON persistence, and CRUD operations
 for employees, quotas, schedules, and application settings.
 """
 
+import copy
+import hashlib
 import json
 import logging
+import os
+import shutil
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime, date
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict, field
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass, asdict, field, is_dataclass
 from pathlib import Path
-from calendar import monthrange
-import calendar
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib encoder
+    orjson = None
+
+# Shift slots of a schedule day, in [day, night] count order
+_SHIFT_KEYS = ("day_shift", "night_shift")
+
+# Days per month, indexed by month number (February adjusted for leap years)
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# (severity, description qualifier) indexed by min(abs(quota deviation), 6)
+_DEVIATION_SEVERITY = (
+    ("none", "Exactly"),  # Unused: zero deviation is reported as "exact"
+    ("low", "Slightly"),
+    ("low", "Slightly"),
+    ("medium", "Moderately"),
+    ("medium", "Moderately"),
+    ("medium", "Moderately"),
+    ("high", "Significantly"),
+)
+
+# Default per-employee monthly quotas by experience level and month length
+_DEFAULT_QUOTAS: Dict[str, Dict[int, int]] = {
+    "High": {28: 22, 29: 22, 30: 23, 31: 24},
+    "Low": {28: 18, 29: 21, 30: 21, 31: 21},
+}
+
+# Same table keyed by (lowercase experience, month length) for the
+# pre-bucket quota fallback, which defaults unknown combinations to 20
+_LEGACY_QUOTAS: Dict[Tuple[str, int], int] = {
+    (level.lower(), days): quota
+    for level, by_days in _DEFAULT_QUOTAS.items()
+    for days, quota in by_days.items()
+}
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """Number of days in a month, without calendar.monthrange's weekday work"""
+    if month == 2 and (year % 4 == 0 and year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month]
+
+
+@lru_cache(maxsize=256)
+def _parse_month_key(month_key: str) -> Tuple[int, int, int]:
+    """Split a "YYYY-MM" month key into (year, month, days in month)"""
+    year, month = map(int, month_key.split("-"))
+    return year, month, _days_in_month(year, month)
 
 
 class DataManagerError(Exception):
@@ -45,7 +100,115 @@ class DataValidationError(DataManagerError):
     pass
 
 
-@dataclass
+def _fsync_directory(directory: Path):
+    """Flush a directory entry so a preceding rename survives a crash (POSIX only)"""
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize dataclass instances (e.g. DeviationFlag) for the stdlib encoder"""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@lru_cache(maxsize=256)
+def _compute_distribution(
+    method: str,
+    names: Tuple[str, ...],
+    weights: Optional[Tuple[float, ...]],
+    target_shifts: int,
+) -> Tuple[Tuple[str, int], ...]:
+    """Split a bucket target into (name, quota) pairs; pure, so results are cached"""
+    if method == "weighted":
+        # Weighted distribution based on weight_factors
+        total_weight = sum(weights)
+        if total_weight > 0:
+            return tuple(
+                (name, round((weight / total_weight) * target_shifts))
+                for name, weight in zip(names, weights)
+            )
+        # Fallback to equal if no weights
+        method = "equal"
+    elif method == "proportional":
+        # Proportional based on some metric (could be extended)
+        # For now, fallback to equal
+        method = "equal"
+
+    if method != "equal":
+        return ()
+
+    # Equal distribution
+    base_quota, remainder = divmod(target_shifts, len(names))
+    return tuple(
+        (name, base_quota + 1 if i < remainder else base_quota)
+        for i, name in enumerate(names)
+    )
+
+
+def _index_shift(
+    shifts_by_emp: Dict[Any, Dict[str, set]],
+    shift_info: Optional[Dict[str, Any]],
+    date_str: str,
+    shift_type: str,
+    add: bool = True,
+):
+    """Add (or remove) one shift in a month's per-employee shift index"""
+    if not shift_info:
+        return
+    emp_shifts = shifts_by_emp.get(shift_info.get("employee_id"))
+    if emp_shifts is None:
+        emp_shifts = shifts_by_emp[shift_info.get("employee_id")] = {
+            "day_shift": set(),
+            "night_shift": set(),
+            "manual": set(),  # (date_str, shift_type) pairs
+        }
+    if add:
+        emp_shifts[shift_type].add(date_str)
+        if shift_info.get("is_manual"):
+            emp_shifts["manual"].add((date_str, shift_type))
+    else:
+        emp_shifts[shift_type].discard(date_str)
+        emp_shifts["manual"].discard((date_str, shift_type))
+
+
+def _normalize_schedule(schedule: Dict[str, Dict[str, Any]]):
+    """Convert a month's schedule in place to dict shift entries with both shift keys"""
+    for day_data in schedule.values():
+        for shift_type in _SHIFT_KEYS:
+            shift_info = day_data.get(shift_type)
+            if shift_info is None:
+                day_data[shift_type] = None
+            elif not isinstance(shift_info, dict):
+                # Old format: direct employee ID
+                day_data[shift_type] = {"employee_id": shift_info, "is_manual": False}
+
+
+def _loads_json(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        # orjson serializes dataclasses natively
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode(
+        "utf-8"
+    )
+
+
+@dataclass(slots=True)
 class ExperienceBucket:
     """Experience bucket configuration for dynamic quota allocation"""
 
@@ -59,7 +222,7 @@ class ExperienceBucket:
     )  # {employee_name: weight} for weighted distribution
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviationFlag:
     """Deviation flag for quota violations"""
 
@@ -69,52 +232,70 @@ class DeviationFlag:
     severity: str  # "low", "medium", "high"
     description: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "employee_name": self.employee_name,
+            "deviation_type": self.deviation_type,
+            "deviation_units": self.deviation_units,
+            "severity": self.severity,
+            "description": self.description,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class EmployeePreferences:
     """Employee preferences for scheduling"""
 
-    off_shifts: List[Tuple[str, str]] = field(
-        default_factory=list
-    )  # List of (date_str, shift_type) tuples
+    off_shifts: Set[Tuple[str, str]] = field(
+        default_factory=set
+    )  # Set of (date_str, shift_type) tuples
     preferred_shift_types: List[str] = field(
         default_factory=lambda: ["both"]
     )  # ["day", "night", "both"]
-    custom_quotas: Dict[str, int] = field(
+    custom_quotas: Dict[int, int] = field(
         default_factory=dict
-    )  # {month_length: quota} e.g., {"31": 25}
+    )  # {month_length: quota} e.g., {31: 25}; stored with string keys in JSON
     availability_notes: str = ""  # Additional notes
 
+    def __post_init__(self):
+        # Accept any iterable of (date, shift) pairs; a set makes membership O(1)
+        if not isinstance(self.off_shifts, set):
+            self.off_shifts = {(date, shift) for date, shift in self.off_shifts}
+
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "offShifts": [(date, shift) for date, shift in self.off_shifts],
+            "offShifts": sorted(self.off_shifts),
             "preferredShiftTypes": self.preferred_shift_types,
-            "customQuotas": self.custom_quotas,
+            "customQuotas": {
+                str(days): quota for days, quota in self.custom_quotas.items()
+            },
             "availabilityNotes": self.availability_notes,
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "EmployeePreferences":
         # Handle backward compatibility for old "offDays" format
-        off_shifts = []
+        off_shifts = set()
         if "offShifts" in data:
             # New format: list of [date, shift] pairs
-            off_shifts = [(item[0], item[1]) for item in data.get("offShifts", [])]
+            off_shifts = {(item[0], item[1]) for item in data.get("offShifts", ())}
         elif "offDays" in data:
             # Old format: list of date strings - convert to both shifts off
-            off_days = data.get("offDays", [])
-            for date_str in off_days:
-                off_shifts.extend([(date_str, "day"), (date_str, "night")])
+            for date_str in data.get("offDays", ()):
+                off_shifts.add((date_str, "day"))
+                off_shifts.add((date_str, "night"))
 
         return cls(
             off_shifts=off_shifts,
             preferred_shift_types=data.get("preferredShiftTypes", ["both"]),
-            custom_quotas=data.get("customQuotas", {}),
+            custom_quotas={
+                int(days): quota for days, quota in data.get("customQuotas", {}).items()
+            },
             availability_notes=data.get("availabilityNotes", ""),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Employee:
     """Employee data structure with experience level and preferences"""
 
@@ -147,21 +328,49 @@ class Employee:
 class DataManager:
     """Manages all data persistence and CRUD operations"""
 
+    # Top-level sections created by _create_default_data, in file order
+    _DEFAULT_KEYS = (
+        "settings",
+        "employees",
+        "experience_buckets",
+        "quotas",
+        "absences",
+        "schedules",
+        "manual_adjustments",
+        "statistics",
+    )
+
     def __init__(self, data_file: str = "data/schedule_data.json"):
         if data_file == "data/schedule_data.json":
             # Use path relative to the package directory
             data_file = Path(__file__).parent.parent / "data" / "schedule_data.json"
         self.data_file = Path(data_file)
+        self._employee_cache: Optional[Dict[int, Employee]] = None
+        self._employee_records: Optional[Dict[int, Dict[str, Any]]] = None
+        self._employee_positions: Optional[Dict[int, int]] = None
+        self._employees_by_name: Optional[Dict[str, Employee]] = None
+        self._off_shift_index: Optional[Dict[int, Set[Tuple[str, str]]]] = None
+        self._preferred_types_index: Optional[Dict[int, List[str]]] = None
+        self._active_employees_by_experience: Optional[Dict[str, List[Employee]]] = None
+        self._bucket_cache: Optional[Dict[str, ExperienceBucket]] = None
+        # month_key -> employee ID -> {"day_shift"/"night_shift": dates, "manual": ...}
+        self._shift_index: Dict[str, Dict[Any, Dict[str, set]]] = {}
+        self._revision = 0  # Bumped whenever schedules or their inputs change
+        self._dirty = False  # A save was requested inside a batch
+        self._backup_taken = False  # .bak is refreshed on the first save only
+        self._batch_depth = 0
+        self._save_lock = threading.Lock()
+        self._saved_digest: Optional[bytes] = None  # Digest of the last write
         self.data = self._load_or_create_data()
+        self._max_emp_id = self._compute_max_employee_id()
 
     def _load_or_create_data(self) -> Dict[str, Any]:
         """Load existing data or create default structure with recovery from backup"""
         if self.data_file.exists():
             try:
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    # Ensure all required sections exist
-                    return self._validate_and_migrate_data(data)
+                data = _loads_json(self.data_file.read_bytes())
+                # Ensure all required sections exist
+                return self._validate_and_migrate_data(data)
             except (json.JSONDecodeError, IOError) as e:
                 logging.error(f"Error loading main data file {self.data_file}: {e}")
                 # Try to recover from backup
@@ -171,12 +380,11 @@ class DataManager:
                         logging.info(
                             f"Attempting recovery from backup file {backup_file}"
                         )
-                        with open(backup_file, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                            # Restore backup to main file
-                            backup_file.replace(self.data_file)
-                            logging.info(f"Successfully recovered data from backup")
-                            return self._validate_and_migrate_data(data)
+                        data = _loads_json(backup_file.read_bytes())
+                        # Restore backup to main file
+                        backup_file.replace(self.data_file)
+                        logging.info(f"Successfully recovered data from backup")
+                        return self._validate_and_migrate_data(data)
                     except (json.JSONDecodeError, IOError) as backup_e:
                         logging.error(f"Backup file also corrupted: {backup_e}")
                         logging.info(f"Creating default data due to corrupted files")
@@ -193,12 +401,11 @@ class DataManager:
                     logging.info(
                         f"Main data file missing, attempting recovery from backup {backup_file}"
                     )
-                    with open(backup_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        # Restore backup to main file
-                        backup_file.replace(self.data_file)
-                        logging.info(f"Successfully recovered data from backup")
-                        return self._validate_and_migrate_data(data)
+                    data = _loads_json(backup_file.read_bytes())
+                    # Restore backup to main file
+                    backup_file.replace(self.data_file)
+                    logging.info(f"Successfully recovered data from backup")
+                    return self._validate_and_migrate_data(data)
                 except (json.JSONDecodeError, IOError) as backup_e:
                     logging.error(f"Backup file corrupted: {backup_e}")
                     logging.info(f"Creating default data due to corrupted backup")
@@ -209,19 +416,28 @@ class DataManager:
 
     def _validate_and_migrate_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate and migrate data structure to current version"""
-        default_data = self._create_default_data()
-
-        # Merge with defaults to ensure all keys exist
-        for key in default_data:
-            if key not in data:
+        # Merge with defaults to ensure all keys exist, only building the
+        # default structure when a section is actually missing
+        missing_keys = [key for key in self._DEFAULT_KEYS if key not in data]
+        if missing_keys:
+            default_data = self._create_default_data()
+            for key in missing_keys:
                 data[key] = default_data[key]
 
-        # Ensure employees have experience field and preferences
+        # Ensure employees have experience field and preferences. The default
+        # preferences are built once; each employee gets its own copy of the
+        # nested lists/dicts so later edits don't leak between employees.
+        default_prefs = EmployeePreferences().to_dict()
         for emp in data.get("employees", []):
-            if "experience" not in emp:
-                emp["experience"] = "Low"
+            emp.setdefault("experience", "Low")
             if "preferences" not in emp:
-                emp["preferences"] = EmployeePreferences().to_dict()
+                emp["preferences"] = {
+                    key: copy.copy(value) for key, value in default_prefs.items()
+                }
+
+        # Convert old-format schedules once so get_schedule can return them as is
+        for schedule in data.get("schedules", {}).values():
+            _normalize_schedule(schedule)
 
         # Ensure experience buckets exist
         if "experience_buckets" not in data:
@@ -272,31 +488,39 @@ class DataManager:
             "statistics": {},  # Cached stats for performance
         }
 
+    def _check_required_sections(self, data: Dict[str, Any], source: str):
+        """Raise DataValidationError if a required top-level section is missing"""
+        required_keys = [
+            "settings",
+            "employees",
+            "experience_buckets",
+            "quotas",
+            "absences",
+            "schedules",
+        ]
+        for key in required_keys:
+            if key not in data:
+                raise DataValidationError(
+                    f"Required section '{key}' missing from {source}"
+                )
+
     def _validate_saved_data(self) -> bool:
-        """Validate that the saved data file matches current data"""
+        """
+        Validate that the saved data file matches current data.
+
+        Re-reads and re-parses the whole file, so it is meant for explicit
+        integrity checks and is not run on the save_data() path.
+        """
         try:
             if not self.data_file.exists():
                 raise DataFileNotFoundError(
                     f"Saved data file {self.data_file} does not exist"
                 )
 
-            with open(self.data_file, "r", encoding="utf-8") as f:
-                saved_data = json.load(f)
+            saved_data = _loads_json(self.data_file.read_bytes())
 
             # Check required sections exist
-            required_keys = [
-                "settings",
-                "employees",
-                "experience_buckets",
-                "quotas",
-                "absences",
-                "schedules",
-            ]
-            for key in required_keys:
-                if key not in saved_data:
-                    raise DataValidationError(
-                        f"Required section '{key}' missing from saved data"
-                    )
+            self._check_required_sections(saved_data, "saved data")
 
             # Check settings version
             if saved_data.get("settings", {}).get("appVersion") != self.data.get(
@@ -309,61 +533,80 @@ class DataManager:
         except (json.JSONDecodeError, IOError) as e:
             raise DataValidationError(f"Failed to validate saved data: {e}")
 
-    def _prepare_data_for_json(self) -> Dict[str, Any]:
-        """Prepare data for JSON serialization by converting objects to dicts"""
-        prepared_data = self.data.copy()
-
-        # Convert DeviationFlag objects in statistics to dicts
-        if "statistics" in prepared_data:
-            for month_key, stats_data in prepared_data["statistics"].items():
-                if "deviation_flags" in stats_data:
-                    deviation_flags = stats_data["deviation_flags"]
-                    prepared_flags = []
-                    for flag in deviation_flags:
-                        if hasattr(flag, "__dataclass_fields__"):
-                            prepared_flags.append(asdict(flag))
-                        else:
-                            prepared_flags.append(flag)
-                    stats_data["deviation_flags"] = prepared_flags
-
-        return prepared_data
+    @contextmanager
+    def batch(self):
+        """
+        Coalesce saves: save_data() calls made inside the block are deferred
+        and written once when the outermost batch exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._save_now()
 
     def save_data(self) -> bool:
+        """Save current data to file, deferring the write while inside batch()"""
+        self._dirty = True
+        if self._batch_depth > 0:
+            return True
+        return self._save_now()
+
+    def _save_now(self) -> bool:
         """Save current data to file atomically with validation"""
-        temp_file = None
         backup_file = self.data_file.with_suffix(".bak")
+        temp_file = self.data_file.with_suffix(".tmp")
 
         try:
-            # Create backup of existing file if it exists
-            if self.data_file.exists():
-                self.data_file.replace(backup_file)
-
-            # Write to temporary file first (atomic operation)
-            temp_file = self.data_file.with_suffix(".tmp")
-
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    self._prepare_data_for_json(), f, indent=2, ensure_ascii=False
-                )
-
-            # Atomic rename: move temp file to final location
-            temp_file.replace(self.data_file)
+            # Validate and serialize the in-memory data before touching any
+            # file, so the file operations below are as short as possible
+            self._check_required_sections(self.data, "data to save")
+            payload = _dumps_json(self.data)
+
+            # Skip the write when the file already holds exactly this payload
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            if digest == self._saved_digest and self.data_file.exists():
+                self._dirty = False
+                return True
 
-            # Validate the saved data
-            self._validate_saved_data()
+            # Saves may come from background threads and share the temp path
+            with self._save_lock:
+                try:
+                    # Back up the file this session started from once; later
+                    # saves replace the main file in place without moving it
+                    if not self._backup_taken:
+                        if self.data_file.exists():
+                            shutil.copy2(self.data_file, backup_file)
+                        self._backup_taken = True
+
+                    # Write to temporary file first (atomic operation)
+                    with open(temp_file, "wb") as f:
+                        f.write(payload)
+                        f.flush()
+                        os.fsync(f.fileno())
+
+                    # Atomic rename: move temp file to final location
+                    os.replace(temp_file, self.data_file)
+                    _fsync_directory(self.data_file.parent)
+                    self._saved_digest = digest
+                finally:
+                    # Clean up temp file if it still exists
+                    if temp_file.exists():
+                        try:
+                            temp_file.unlink()
+                        except Exception as cleanup_e:
+                            logging.error(
+                                f"Failed to clean up temporary file {temp_file}: {cleanup_e}",
+                                exc_info=True,
+                            )
 
+            self._dirty = False
             return True
 
         except DataValidationError as e:
-            logging.error(f"Data validation failed after save: {e}", exc_info=True)
-            # Try to restore from backup
-            if backup_file.exists():
-                try:
-                    backup_file.replace(self.data_file)
-                except Exception as restore_e:
-                    logging.error(
-                        f"Failed to restore from backup: {restore_e}", exc_info=True
-                    )
+            logging.error(f"Data validation failed before save: {e}", exc_info=True)
             raise DataSaveError(f"Save operation failed validation: {e}")
 
         except (IOError, OSError) as e:
@@ -374,40 +617,88 @@ class DataManager:
             logging.error(f"Unexpected error during save operation: {e}", exc_info=True)
             raise DataSaveError(f"Unexpected error during save: {e}")
 
-        finally:
-            # Clean up temp file if it still exists
-            if temp_file and temp_file.exists():
-                try:
-                    temp_file.unlink()
-                except Exception as cleanup_e:
-                    logging.error(
-                        f"Failed to clean up temporary file {temp_file}: {cleanup_e}",
-                        exc_info=True,
-                    )
-
     # Employee Management
-    def get_employees(self, active_only: bool = True) -> List[Employee]:
-        """Get list of employees"""
-        employees = []
-        for emp_data in self.data.get("employees", []):
+    def _build_employee_index(self):
+        """Parse raw employee records once and index them by ID and name"""
+        self._employee_cache = {}
+        self._employee_records = {}
+        self._employee_positions = {}
+        self._employees_by_name = {}
+        self._off_shift_index = {}
+        self._preferred_types_index = {}
+        self._active_employees_by_experience = {}
+        for position, emp_data in enumerate(self.data.get("employees", [])):
             emp = Employee.from_dict(emp_data)
+            self._employee_cache[emp.id] = emp
+            self._employee_records[emp.id] = emp_data
+            self._employee_positions[emp.id] = position
+            # Keep the first match, as the former linear scan did
+            self._employees_by_name.setdefault(emp.name, emp)
+            # Fast-path lookups for the scheduler's per-cell eligibility checks
+            self._off_shift_index[emp.id] = emp.preferences.off_shifts
+            self._preferred_types_index[emp.id] = emp.preferences.preferred_shift_types
+            if emp.is_active:
+                self._active_employees_by_experience.setdefault(
+                    emp.experience, []
+                ).append(emp)
+
+    def _compute_max_employee_id(self) -> int:
+        """Get the highest employee ID currently in use (0 when there are none)"""
+        return max((emp["id"] for emp in self.data.get("employees", ())), default=0)
+
+    @property
+    def revision(self) -> int:
+        """Counter that changes whenever schedules or statistics inputs change"""
+        return self._revision
+
+    def _get_employee_cache(self) -> Dict[int, Employee]:
+        """Get parsed Employee objects keyed by ID, building the index on demand"""
+        if self._employee_cache is None:
+            self._build_employee_index()
+        return self._employee_cache
+
+    def _get_employee_record(self, emp_id: int) -> Optional[Dict[str, Any]]:
+        """Get the raw employee dict stored in self.data for an employee ID"""
+        if self._employee_cache is None:
+            self._build_employee_index()
+        return self._employee_records.get(emp_id)
+
+    def _invalidate_employee_cache(self):
+        """Drop cached Employee objects after the raw employee data changed"""
+        self._revision += 1
+        self._employee_cache = None
+        self._employee_records = None
+        self._employee_positions = None
+        self._employees_by_name = None
+        self._off_shift_index = None
+        self._preferred_types_index = None
+        self._active_employees_by_experience = None
+
+    def iter_employees(self, active_only: bool = True) -> Iterator[Employee]:
+        """Iterate over employees lazily (shared cached objects, treat as read-only)"""
+        for emp in self._get_employee_cache().values():
             if not active_only or emp.is_active:
-                employees.append(emp)
-        return employees
+                yield emp
+
+    def _get_active_bucket_employees(self, experience_level: str) -> List[Employee]:
+        """Get active employees of one experience level (shared cached list)"""
+        if self._active_employees_by_experience is None:
+            self._build_employee_index()
+        return self._active_employees_by_experience.get(experience_level, [])
+
+    def get_employees(self, active_only: bool = True) -> List[Employee]:
+        """Get list of employees (shared cached objects, treat as read-only)"""
+        return list(self.iter_employees(active_only))
 
     def get_employee_by_id(self, emp_id: int) -> Optional[Employee]:
         """Get employee by ID"""
-        for emp_data in self.data.get("employees", []):
-            if emp_data["id"] == emp_id:
-                return Employee.from_dict(emp_data)
-        return None
+        return self._get_employee_cache().get(emp_id)
 
     def get_employee_by_name(self, name: str) -> Optional[Employee]:
         """Get employee by name"""
-        for emp_data in self.data.get("employees", []):
-            if emp_data["name"] == name:
-                return Employee.from_dict(emp_data)
-        return None
+        if self._employee_cache is None:
+            self._build_employee_index()
+        return self._employees_by_name.get(name)
 
     def add_employee(
         self,
@@ -418,8 +709,8 @@ class DataManager:
     ) -> Employee:
         """Add new employee"""
         # Get next ID
-        existing_ids = [emp["id"] for emp in self.data.get("employees", [])]
-        next_id = max(existing_ids, default=0) + 1
+        self._max_emp_id += 1
+        next_id = self._max_emp_id
 
         # Create employee
         if preferences is None:
@@ -435,6 +726,7 @@ class DataManager:
 
         # Add to data
         self.data.setdefault("employees", []).append(employee.to_dict())
+        self._invalidate_employee_cache()
 
         # Add default quotas for all month lengths
         self._add_default_quotas_for_employee(name, experience)
@@ -443,8 +735,7 @@ class DataManager:
         self._update_bucket_targets_for_experience(experience)
 
         # Redistribute quotas in the experience bucket
-        for month_length in [28, 29, 30, 31]:
-            self._redistribute_bucket_quotas(experience, month_length)
+        self._redistribute_bucket_quotas(experience)
 
         return employee
 
@@ -457,63 +748,57 @@ class DataManager:
         preferences: EmployeePreferences = None,
     ) -> bool:
         """Update employee information"""
-        for emp_data in self.data.get("employees", []):
-            if emp_data["id"] == emp_id:
-                old_name = emp_data["name"]
-                old_experience = emp_data["experience"]
-                old_active = emp_data["isActive"]
-
-                if name is not None:
-                    emp_data["name"] = name
-                if experience is not None:
-                    emp_data["experience"] = experience
-                if is_active is not None:
-                    emp_data["isActive"] = is_active
-                if preferences is not None:
-                    emp_data["preferences"] = preferences.to_dict()
-
-                # Update quotas if name or experience changed
-                if name and name != old_name:
-                    self._update_quotas_for_renamed_employee(old_name, name)
-                if experience and experience != old_experience:
-                    self._update_quotas_for_experience_change(
-                        emp_data["name"], experience
-                    )
-                    # Update bucket targets for old and new experience levels
-                    if old_experience:
-                        self._update_bucket_targets_for_experience(old_experience)
-                    self._update_bucket_targets_for_experience(experience)
-                    # Redistribute in old and new buckets
-                    for month_length in [28, 29, 30, 31]:
-                        if old_experience:
-                            self._redistribute_bucket_quotas(
-                                old_experience, month_length
-                            )
-                        self._redistribute_bucket_quotas(experience, month_length)
-                elif is_active is not None and is_active != old_active:
-                    # Update bucket targets when active status changes
-                    current_experience = experience or old_experience
-                    self._update_bucket_targets_for_experience(current_experience)
-                    # Redistribute when active status changes
-                    for month_length in [28, 29, 30, 31]:
-                        self._redistribute_bucket_quotas(
-                            current_experience, month_length
-                        )
+        emp_data = self._get_employee_record(emp_id)
+        if emp_data is None:
+            return False
 
-                return True
-        return False
+        old_name = emp_data["name"]
+        old_experience = emp_data["experience"]
+        old_active = emp_data["isActive"]
+
+        if name is not None:
+            emp_data["name"] = name
+        if experience is not None:
+            emp_data["experience"] = experience
+        if is_active is not None:
+            emp_data["isActive"] = is_active
+        if preferences is not None:
+            emp_data["preferences"] = preferences.to_dict()
+        self._invalidate_employee_cache()
+
+        # Update quotas if name or experience changed
+        if name and name != old_name:
+            self._update_quotas_for_renamed_employee(old_name, name)
+        if experience and experience != old_experience:
+            self._update_quotas_for_experience_change(emp_data["name"], experience)
+            self._invalidate_employee_cache()
+            # Update bucket targets for old and new experience levels
+            if old_experience:
+                self._update_bucket_targets_for_experience(old_experience)
+            self._update_bucket_targets_for_experience(experience)
+            # Redistribute in old and new buckets
+            if old_experience:
+                self._redistribute_bucket_quotas(old_experience)
+            self._redistribute_bucket_quotas(experience)
+        elif is_active is not None and is_active != old_active:
+            # Update bucket targets when active status changes
+            current_experience = experience or old_experience
+            self._update_bucket_targets_for_experience(current_experience)
+            # Redistribute when active status changes
+            self._redistribute_bucket_quotas(current_experience)
+
+        return True
 
     def delete_employee(self, emp_id: int) -> bool:
         """Delete employee (hard delete)"""
-        employees = self.data.get("employees", [])
-        employee_to_delete = None
-        for emp in employees:
-            if emp["id"] == emp_id:
-                employee_to_delete = emp
-                break
+        employee_to_delete = self._get_employee_record(emp_id)
 
         if employee_to_delete:
-            employees.remove(employee_to_delete)
+            # Delete by position so employee order is kept without a list scan
+            del self.data["employees"][self._employee_positions[emp_id]]
+            self._invalidate_employee_cache()
+            if employee_to_delete["id"] == self._max_emp_id:
+                self._max_emp_id = self._compute_max_employee_id()
             # Also remove any related data if necessary (e.g., quotas)
             for month_quotas in self.data.get("quotas", {}).values():
                 if employee_to_delete["name"] in month_quotas:
@@ -536,49 +821,38 @@ class DataManager:
         self, emp_id: int, date_str: str, shift_type: str
     ) -> bool:
         """Check if specific shift is off for employee"""
-        prefs = self.get_employee_preferences(emp_id)
-        if not prefs:
-            return False
-        return (date_str, shift_type) in prefs.off_shifts
+        if self._off_shift_index is None:
+            self._build_employee_index()
+        return (date_str, shift_type) in self._off_shift_index.get(emp_id, ())
 
     def is_employee_off_day(self, emp_id: int, date_str: str) -> bool:
         """Check if date is an off-day for employee (backward compatibility)"""
-        prefs = self.get_employee_preferences(emp_id)
-        if not prefs:
-            return False
+        if self._off_shift_index is None:
+            self._build_employee_index()
+        off_shifts = self._off_shift_index.get(emp_id, ())
         # Check if both shifts are off for this date
-        return (date_str, "day") in prefs.off_shifts and (
-            date_str,
-            "night",
-        ) in prefs.off_shifts
+        return (date_str, "day") in off_shifts and (date_str, "night") in off_shifts
 
     def get_employee_preferred_shift_types(self, emp_id: int) -> List[str]:
         """Get employee's preferred shift types"""
-        prefs = self.get_employee_preferences(emp_id)
-        return prefs.preferred_shift_types if prefs else ["both"]
+        if self._preferred_types_index is None:
+            self._build_employee_index()
+        return self._preferred_types_index.get(emp_id, ["both"])
 
     # Quota Management
     def get_quotas_for_month(self, days_in_month: int) -> Dict[str, int]:
         """Get quotas for specific month length using bucket system"""
-        month_key = str(days_in_month)
-        quotas = {}
-
         # Get quotas from bucket system
-        for emp in self.get_employees(active_only=True):
-            quota = self.get_bucket_quota_for_employee(emp.name, days_in_month)
-            quotas[emp.name] = quota
+        quotas = self._get_bucket_quotas(days_in_month)
 
         # Fallback to old system if no bucket quotas
         if not quotas:
-            old_quotas = {
-                31: {"high": 24, "low": 21},
-                30: {"high": 23, "low": 21},
-                29: {"high": 22, "low": 21},
-                28: {"high": 22, "low": 18},
-            }
-            default_quotas = old_quotas.get(days_in_month, {})
-            for emp in self.get_employees(active_only=True):
-                quotas[emp.name] = default_quotas.get(emp.experience.lower(), 20)
+            for emp_data in self.data.get("employees", ()):
+                if emp_data.get("isActive", True):
+                    experience = emp_data.get("experience", "Low").lower()
+                    quotas[emp_data["name"]] = _LEGACY_QUOTAS.get(
+                        (experience, days_in_month), 20
+                    )
 
         return quotas
 
@@ -588,26 +862,22 @@ class DataManager:
         if month_key not in self.data.setdefault("quotas", {}):
             self.data["quotas"][month_key] = {}
         self.data["quotas"][month_key][employee_name] = quota
+        self._revision += 1
 
         # Also set as custom quota in employee preferences
         emp = self.get_employee_by_name(employee_name)
         if emp:
-            emp.preferences.custom_quotas[month_key] = quota
+            emp.preferences.custom_quotas[days_in_month] = quota
             # Update the employee data
-            for emp_data in self.data.get("employees", []):
-                if emp_data["name"] == employee_name:
-                    emp_data["preferences"] = emp.preferences.to_dict()
-                    break
+            emp_data = self._get_employee_record(emp.id)
+            emp_data["preferences"] = emp.preferences.to_dict()
 
     def get_default_quota_for_experience(
         self, experience: str, days_in_month: int
     ) -> int:
         """Get default quota based on experience level and month length"""
-        defaults = {
-            "High": {28: 22, 29: 22, 30: 23, 31: 24},
-            "Low": {28: 18, 29: 21, 30: 21, 31: 21},
-        }
-        return defaults.get(experience, defaults["Low"]).get(days_in_month, 20)
+        by_days = _DEFAULT_QUOTAS.get(experience, _DEFAULT_QUOTAS["Low"])
+        return by_days.get(days_in_month, 20)
 
     def _add_default_quotas_for_employee(self, name: str, experience: str):
         """Add default quotas for new employee"""
@@ -628,11 +898,8 @@ class DataManager:
         during the subsequent bucket redistribution.
         """
         # Find the specific employee's data to update their preferences
-        emp_data_to_update = None
-        for emp_data in self.data.get("employees", []):
-            if emp_data["name"] == name:
-                emp_data_to_update = emp_data
-                break
+        emp = self.get_employee_by_name(name)
+        emp_data_to_update = self._get_employee_record(emp.id) if emp else None
 
         if not emp_data_to_update:
             logging.warning(
@@ -659,31 +926,35 @@ class DataManager:
                 emp_data_to_update["preferences"]["customQuotas"][days] = new_quota
 
     # Experience Bucket Management
+    def _get_bucket_cache(self) -> Dict[str, ExperienceBucket]:
+        """Get ExperienceBucket objects keyed by level, building them on demand"""
+        if self._bucket_cache is None:
+            self._bucket_cache = {}
+            for exp_level, bucket_data in self.data.get(
+                "experience_buckets", {}
+            ).items():
+                self._bucket_cache[exp_level] = ExperienceBucket(
+                    experience_level=bucket_data["experience_level"],
+                    target_shifts=bucket_data["target_shifts"],
+                    distribution_method=bucket_data.get("distribution_method", "equal"),
+                    weight_factors=bucket_data.get("weight_factors", {}),
+                )
+        return self._bucket_cache
+
+    def _invalidate_bucket_cache(self):
+        """Drop cached ExperienceBucket objects after the raw bucket data changed"""
+        self._revision += 1
+        self._bucket_cache = None
+
     def get_experience_buckets(self) -> Dict[str, ExperienceBucket]:
         """Get all experience buckets"""
-        buckets = {}
-        for exp_level, bucket_data in self.data.get("experience_buckets", {}).items():
-            buckets[exp_level] = ExperienceBucket(
-                experience_level=bucket_data["experience_level"],
-                target_shifts=bucket_data["target_shifts"],
-                distribution_method=bucket_data.get("distribution_method", "equal"),
-                weight_factors=bucket_data.get("weight_factors", {}),
-            )
-        return buckets
+        return dict(self._get_bucket_cache())
 
     def get_experience_bucket(
         self, experience_level: str
     ) -> Optional[ExperienceBucket]:
         """Get specific experience bucket"""
-        bucket_data = self.data.get("experience_buckets", {}).get(experience_level)
-        if bucket_data:
-            return ExperienceBucket(
-                experience_level=bucket_data["experience_level"],
-                target_shifts=bucket_data["target_shifts"],
-                distribution_method=bucket_data.get("distribution_method", "equal"),
-                weight_factors=bucket_data.get("weight_factors", {}),
-            )
-        return None
+        return self._get_bucket_cache().get(experience_level)
 
     def set_experience_bucket_target(
         self, experience_level: str, month_length: int, target_shifts: int
@@ -703,7 +974,8 @@ class DataManager:
         self.data["experience_buckets"][experience_level]["target_shifts"][
             str(month_length)
         ] = target_shifts
-        self._redistribute_bucket_quotas(experience_level, month_length)
+        self._invalidate_bucket_cache()
+        self._redistribute_bucket_quotas(experience_level, (month_length,))
 
     def set_bucket_distribution_method(
         self,
@@ -720,14 +992,14 @@ class DataManager:
                 self.data["experience_buckets"][experience_level][
                     "weight_factors"
                 ] = weight_factors
+            self._invalidate_bucket_cache()
 
             # Redistribute quotas for all month lengths
             bucket = self.get_experience_bucket(experience_level)
             if bucket:
-                for month_length in bucket.target_shifts.keys():
-                    self._redistribute_bucket_quotas(
-                        experience_level, int(month_length)
-                    )
+                self._redistribute_bucket_quotas(
+                    experience_level, [int(m) for m in bucket.target_shifts]
+                )
 
     def _update_bucket_targets_for_experience(self, experience_level: str):
         """Update bucket targets to maintain static per-employee quotas when employees are added/removed"""
@@ -735,13 +1007,13 @@ class DataManager:
         if not bucket:
             return
 
-        # Get active employees in this experience bucket
-        bucket_employees = [
-            emp
-            for emp in self.get_employees()
-            if emp.experience == experience_level and emp.is_active
-        ]
-        num_employees = len(bucket_employees)
+        # Count active employees in this experience bucket
+        num_employees = sum(
+            1
+            for emp_data in self.data.get("employees", ())
+            if emp_data.get("experience", "Low") == experience_level
+            and emp_data.get("isActive", True)
+        )
 
         if num_employees == 0:
             return
@@ -771,69 +1043,61 @@ class DataManager:
         self.data["experience_buckets"][experience_level][
             "target_shifts"
         ] = bucket.target_shifts
+        self._invalidate_bucket_cache()
 
-    def _redistribute_bucket_quotas(self, experience_level: str, month_length: int):
+    def _redistribute_bucket_quotas(
+        self,
+        experience_level: str,
+        month_lengths: Iterable[int] = (28, 29, 30, 31),
+    ):
         """Redistribute quotas within a bucket based on current employees and distribution method"""
         bucket = self.get_experience_bucket(experience_level)
         if not bucket:
             return
 
-        target_shifts = bucket.target_shifts.get(str(month_length))
-        if target_shifts is None or target_shifts == 0:
-            # If no target set, calculate it dynamically
-            bucket_employees = [
-                emp
-                for emp in self.get_employees()
-                if emp.experience == experience_level and emp.is_active
-            ]
-            num_employees = len(bucket_employees)
-            if num_employees > 0:
+        # Get active employees in this experience bucket once for all month lengths
+        bucket_employees = self._get_active_bucket_employees(experience_level)
+
+        if not bucket_employees:
+            return
+
+        quotas = self.data.setdefault("quotas", {})
+        for month_length in month_lengths:
+            month_key = str(month_length)
+            target_shifts = bucket.target_shifts.get(month_key)
+            if target_shifts is None or target_shifts == 0:
+                # If no target set, calculate it dynamically
                 default_quota = self.get_default_quota_for_experience(
                     experience_level, month_length
                 )
-                target_shifts = num_employees * default_quota
-                bucket.target_shifts[str(month_length)] = target_shifts
+                target_shifts = len(bucket_employees) * default_quota
+                bucket.target_shifts[month_key] = target_shifts
                 # Update data
                 if (
                     "experience_buckets" in self.data
                     and experience_level in self.data["experience_buckets"]
                 ):
                     self.data["experience_buckets"][experience_level]["target_shifts"][
-                        str(month_length)
+                        month_key
                     ] = target_shifts
 
-        if target_shifts == 0:
-            return
-
-        # Get active employees in this experience bucket
-        bucket_employees = [
-            emp
-            for emp in self.get_employees()
-            if emp.experience == experience_level and emp.is_active
-        ]
-
-        if not bucket_employees:
-            return
-
-        # Calculate individual quotas based on distribution method
-        individual_quotas = self._calculate_bucket_distribution(
-            bucket, bucket_employees, month_length, target_shifts
-        )
+            if target_shifts == 0:
+                continue
 
-        # Update quotas in data
-        month_key = str(month_length)
-        if month_key not in self.data.setdefault("quotas", {}):
-            self.data["quotas"][month_key] = {}
+            # Calculate individual quotas based on distribution method
+            individual_quotas = self._calculate_bucket_distribution(
+                bucket, bucket_employees, month_length, target_shifts
+            )
 
-        for emp in bucket_employees:
-            # Check if employee has custom override
-            custom_quota = emp.preferences.custom_quotas.get(month_key)
-            if custom_quota is not None:
-                self.data["quotas"][month_key][emp.name] = custom_quota
-            else:
-                self.data["quotas"][month_key][emp.name] = individual_quotas.get(
-                    emp.name, 0
-                )
+            # Update quotas in data
+            month_quotas = quotas.setdefault(month_key, {})
+            for emp in bucket_employees:
+                # Check if employee has custom override
+                custom_quota = emp.preferences.custom_quotas.get(month_length)
+                if custom_quota is not None:
+                    month_quotas[emp.name] = custom_quota
+                else:
+                    month_quotas[emp.name] = individual_quotas.get(emp.name, 0)
 
     def _calculate_bucket_distribution(
         self,
@@ -846,42 +1110,46 @@ class DataManager:
         if not employees:
             return {}
 
-        quotas = {}
-
-        if bucket.distribution_method == "equal":
-            # Equal distribution
-            base_quota = target_shifts // len(employees)
-            remainder = target_shifts % len(employees)
-
-            for i, emp in enumerate(employees):
-                quota = base_quota
-                if i < remainder:
-                    quota += 1
-                quotas[emp.name] = quota
-
-        elif bucket.distribution_method == "weighted":
-            # Weighted distribution based on weight_factors
-            total_weight = sum(
-                bucket.weight_factors.get(emp.name, 1.0) for emp in employees
+        names = tuple(emp.name for emp in employees)
+        weights = None
+        if bucket.distribution_method == "weighted":
+            weights = tuple(bucket.weight_factors.get(name, 1.0) for name in names)
+        return dict(
+            _compute_distribution(
+                bucket.distribution_method, names, weights, target_shifts
             )
-            if total_weight > 0:
-                for emp in employees:
-                    weight = bucket.weight_factors.get(emp.name, 1.0)
-                    quota = round((weight / total_weight) * target_shifts)
-                    quotas[emp.name] = quota
-            else:
-                # Fallback to equal if no weights
-                return self._calculate_bucket_distribution(
-                    bucket, employees, month_length, target_shifts
-                )
+        )
 
-        elif bucket.distribution_method == "proportional":
-            # Proportional based on some metric (could be extended)
-            # For now, fallback to equal
-            return self._calculate_bucket_distribution(
-                bucket, employees, month_length, target_shifts
-            )
+    def _get_bucket_quotas(self, month_length: int) -> Dict[str, int]:
+        """Get bucket quotas for all active employees, distributing each bucket once"""
+        employees = self.get_employees()  # Also builds the employee index
+
+        # Distribute each bucket's target among its active employees
+        distributions = {}
+        for experience_level, members in self._active_employees_by_experience.items():
+            bucket = self.get_experience_bucket(experience_level)
+            if bucket:
+                target_shifts = bucket.target_shifts.get(str(month_length))
+                if target_shifts is not None:
+                    distributions[experience_level] = (
+                        self._calculate_bucket_distribution(
+                            bucket, members, month_length, target_shifts
+                        )
+                    )
 
+        # Same precedence as get_bucket_quota_for_employee
+        quotas = {}
+        for emp in employees:
+            custom_quota = emp.preferences.custom_quotas.get(month_length)
+            if custom_quota is not None:
+                quota = custom_quota
+            elif emp.experience in distributions:
+                quota = distributions[emp.experience].get(emp.name, 0)
+            else:
+                quota = self.get_default_quota_for_experience(
+                    emp.experience, month_length
+                )
+            quotas.setdefault(emp.name, quota)
         return quotas
 
     def get_bucket_quota_for_employee(
@@ -893,7 +1161,7 @@ class DataManager:
             return 0
 
         # Check for custom override first
-        custom_quota = emp.preferences.custom_quotas.get(str(month_length))
+        custom_quota = emp.preferences.custom_quotas.get(month_length)
         if custom_quota is not None:
             return custom_quota
 
@@ -903,11 +1171,7 @@ class DataManager:
             target_shifts = bucket.target_shifts.get(str(month_length))
             if target_shifts is not None:
                 # Get bucket employees
-                bucket_employees = [
-                    e
-                    for e in self.get_employees()
-                    if e.experience == emp.experience and e.is_active
-                ]
+                bucket_employees = self._get_active_bucket_employees(emp.experience)
                 individual_quotas = self._calculate_bucket_distribution(
                     bucket, bucket_employees, month_length, target_shifts
                 )
@@ -932,6 +1196,7 @@ class DataManager:
             self.data["absences"][emp_key] = []
         if date_str not in self.data["absences"][emp_key]:
             self.data["absences"][emp_key].append(date_str)
+            self._revision += 1
 
     def remove_absence(self, emp_id: int, date_str: str):
         """Remove absence date for employee"""
@@ -939,6 +1204,7 @@ class DataManager:
         if emp_key in self.data.get("absences", {}):
             if date_str in self.data["absences"][emp_key]:
                 self.data["absences"][emp_key].remove(date_str)
+                self._revision += 1
 
     def is_employee_absent(self, emp_id: int, date_str: str) -> bool:
         """Check if employee is absent on specific date"""
@@ -946,45 +1212,17 @@ class DataManager:
 
     # Schedule Management
     def get_schedule(self, month_key: str) -> Dict[str, Dict[str, Dict[str, Any]]]:
-        """Get schedule for specific month, converting old format to new structure if needed"""
-        raw_schedule = self.data.get("schedules", {}).get(month_key, {})
-        schedule = {}
-        for date_str, day_data in raw_schedule.items():
-            schedule[date_str] = {}
-            for shift_type in ["day_shift", "night_shift"]:
-                if shift_type in day_data:
-                    shift_info = day_data[shift_type]
-                    if isinstance(shift_info, int):
-                        # Old format: direct employee ID
-                        schedule[date_str][shift_type] = {
-                            "employee_id": shift_info,
-                            "is_manual": False,  # Assume non-manual for old data
-                        }
-                    else:
-                        # New format: dict
-                        schedule[date_str][shift_type] = shift_info
-                else:
-                    schedule[date_str][shift_type] = None
-        return schedule
+        """Get schedule for specific month (stored data, normalized on load and write)"""
+        return self.data.get("schedules", {}).get(month_key, {})
 
     def save_schedule(
         self, month_key: str, schedule: Dict[str, Dict[str, Dict[str, Any]]]
     ):
         """Save schedule for specific month, ensuring dict format"""
-        # Ensure all shifts are in dict format
-        for date_str, day_data in schedule.items():
-            for shift_type in ["day_shift", "night_shift"]:
-                if (
-                    shift_type in day_data
-                    and day_data[shift_type] is not None
-                    and not isinstance(day_data[shift_type], dict)
-                ):
-                    # Convert old format
-                    day_data[shift_type] = {
-                        "employee_id": day_data[shift_type],
-                        "is_manual": False,
-                    }
+        _normalize_schedule(schedule)
         self.data.setdefault("schedules", {})[month_key] = schedule
+        self._shift_index.pop(month_key, None)
+        self._revision += 1
 
     def save_schedule_with_statistics(
         self, month_key: str, schedule: Dict[str, Dict[str, Optional[int]]]
@@ -992,21 +1230,28 @@ class DataManager:
         """Save schedule and calculate/store statistics with deviation flags"""
         # Save the schedule
         self.save_schedule(month_key, schedule)
+        self._save_statistics(month_key)
 
+    def _save_statistics(self, month_key: str):
+        """Calculate and store statistics for an already stored schedule, then save"""
         # Calculate and store statistics with deviation flags
         emp_stats = self.calculate_employee_stats(month_key)
-        team_stats = self.get_team_stats(month_key)
-
-        # Store in statistics section
-        self.data.setdefault("statistics", {})[month_key] = {
-            "employee_stats": emp_stats,
-            "team_stats": team_stats,
-            "generated_at": datetime.now().isoformat(),
-            "deviation_flags": [
-                asdict(flag) if hasattr(flag, "__dataclass_fields__") else flag
-                for flag in team_stats.get("deviation_flags", [])
-            ],
-        }
+        team_stats = self.get_team_stats(month_key, emp_stats)
+
+        # Store in statistics section, keeping the previous entry (and its
+        # timestamp) when nothing changed so repeated saves are idempotent
+        statistics = self.data.setdefault("statistics", {})
+        previous = statistics.get(month_key) or {}
+        if (
+            previous.get("employee_stats") != emp_stats
+            or previous.get("team_stats") != team_stats
+        ):
+            statistics[month_key] = {
+                "employee_stats": emp_stats,
+                "team_stats": team_stats,
+                "generated_at": datetime.now().isoformat(),
+                "deviation_flags": list(team_stats.get("deviation_flags", [])),
+            }
 
         # Save to file
         self.save_data()
@@ -1015,16 +1260,16 @@ class DataManager:
         self, month_key: str, date_str: str, shift_type: str
     ) -> Optional[int]:
         """Get employee ID assigned to specific shift, handling old and new formats"""
-        schedule = self.get_schedule(month_key)
-        day_data = schedule.get(date_str, {})
-        shift_info = day_data.get(shift_type)
-        if shift_info is None:
-            return None
-        if isinstance(shift_info, dict):
-            return shift_info.get("employee_id")
-        else:
-            # Old format
+        shift_info = (
+            self.data.get("schedules", {})
+            .get(month_key, {})
+            .get(date_str, {})
+            .get(shift_type)
+        )
+        if shift_info is None or isinstance(shift_info, int):
+            # Old format stores the bare employee ID
             return shift_info
+        return shift_info.get("employee_id")
 
     def set_shift_assignment(
         self,
@@ -1035,23 +1280,50 @@ class DataManager:
         is_manual: bool = False,
     ):
         """Set employee assignment for specific shift with manual flag"""
-        if month_key not in self.data.setdefault("schedules", {}):
-            self.data["schedules"][month_key] = {}
-        if date_str not in self.data["schedules"][month_key]:
-            self.data["schedules"][month_key][date_str] = {}
-
-        if emp_id is None:
-            self.data["schedules"][month_key][date_str][shift_type] = None
-        else:
-            self.data["schedules"][month_key][date_str][shift_type] = {
-                "employee_id": emp_id,
-                "is_manual": is_manual,
+        shift_info = (
+            None if emp_id is None else {"employee_id": emp_id, "is_manual": is_manual}
+        )
+        month_schedule = self.data.setdefault("schedules", {}).setdefault(month_key, {})
+        day_data = month_schedule.get(date_str)
+        if day_data is None:
+            day_data = month_schedule[date_str] = {
+                "day_shift": None,
+                "night_shift": None,
             }
 
-        # Track manual adjustment if manual
-        if is_manual:
+        old_shift_info = day_data.get(shift_type)
+        day_data[shift_type] = shift_info
+        self._revision += 1
+
+        # Keep the month's shift index in step with this single-cell change
+        shifts_by_emp = self._shift_index.get(month_key)
+        if shifts_by_emp is not None:
+            if shift_type in _SHIFT_KEYS:
+                _index_shift(
+                    shifts_by_emp, old_shift_info, date_str, shift_type, add=False
+                )
+                _index_shift(shifts_by_emp, shift_info, date_str, shift_type)
+            else:
+                del self._shift_index[month_key]
+
+        # Track manual adjustment if manual (clearing an empty cell changes nothing)
+        if is_manual and (emp_id is not None or old_shift_info is not None):
             self._track_manual_adjustment(month_key, date_str, shift_type, emp_id)
 
+    def _get_shift_index(self, month_key: str) -> Dict[Any, Dict[str, set]]:
+        """Get a month's assigned dates per employee ID (inverse of the schedule)"""
+        shifts_by_emp = self._shift_index.get(month_key)
+        if shifts_by_emp is None:
+            # Built once per month, then updated by set_shift_assignment
+            shifts_by_emp = {}
+            for date_str, day_data in self.get_schedule(month_key).items():
+                for shift_type in _SHIFT_KEYS:
+                    _index_shift(
+                        shifts_by_emp, day_data.get(shift_type), date_str, shift_type
+                    )
+            self._shift_index[month_key] = shifts_by_emp
+        return shifts_by_emp
+
     def _track_manual_adjustment(
         self, month_key: str, date_str: str, shift_type: str, emp_id: Optional[int]
     ):
@@ -1077,41 +1349,36 @@ class DataManager:
     # Statistics and Reporting
     def calculate_employee_stats(self, month_key: str) -> Dict[str, Dict[str, Any]]:
         """Calculate statistics for all employees in given month with deviation flagging"""
-        schedule = self.get_schedule(month_key)
         employees = self.get_employees()
         stats = {}
 
-        # Calculate days in month and get quotas
-        year, month = map(int, month_key.split("-"))
-        days_in_month = monthrange(year, month)[1]
-        quotas = self.get_quotas_for_month(days_in_month)
+        # Calculate days in month and get quotas (each bucket distributed once)
+        days_in_month = _parse_month_key(month_key)[2]
+        quotas = self._get_bucket_quotas(days_in_month)
+
+        # Maintained per-employee shift index: counts are set sizes
+        shifts_by_emp = self._get_shift_index(month_key)
+        absences = self.data.get("absences", {})
 
         for emp in employees:
             # Use bucket-based quota (which already handles custom overrides)
-            emp_quota = self.get_bucket_quota_for_employee(emp.name, days_in_month)
+            emp_quota = quotas[emp.name]
+            emp_shifts = shifts_by_emp.get(emp.id)
+            day_shifts = len(emp_shifts["day_shift"]) if emp_shifts else 0
+            night_shifts = len(emp_shifts["night_shift"]) if emp_shifts else 0
 
             emp_stats = {
                 "name": emp.name,
                 "experience": emp.experience,
-                "day_shifts": 0,
-                "night_shifts": 0,
+                "day_shifts": day_shifts,
+                "night_shifts": night_shifts,
                 "total_shifts": 0,
                 "quota": emp_quota,
                 "quota_deviation": 0,
-                "absences": len(self.get_absences(emp.id)),
+                "absences": len(absences.get(str(emp.id), ())),
                 "deviation_flag": None,  # Will be set below
             }
 
-            # Count shifts
-            for date_data in schedule.values():
-                day_shift_info = date_data.get("day_shift")
-                if day_shift_info and day_shift_info.get("employee_id") == emp.id:
-                    emp_stats["day_shifts"] += 1
-
-                night_shift_info = date_data.get("night_shift")
-                if night_shift_info and night_shift_info.get("employee_id") == emp.id:
-                    emp_stats["night_shifts"] += 1
-
             # Calculate totals (night shifts count as 2)
             emp_stats["total_shifts"] = emp_stats["day_shifts"] + (
                 emp_stats["night_shifts"] * 2
@@ -1128,7 +1395,7 @@ class DataManager:
                 emp_quota,
             )
             emp_stats["deviation_flag"] = (
-                asdict(deviation_flag) if deviation_flag else None
+                deviation_flag.to_dict() if deviation_flag else None
             )
 
             stats[emp.name] = emp_stats
@@ -1149,29 +1416,14 @@ class DataManager:
             )
 
         # Determine deviation type and severity
+        abs_deviation = abs(deviation)
+        severity, qualifier = _DEVIATION_SEVERITY[min(abs_deviation, 6)]
         if deviation > 0:
             deviation_type = "over_quota"
-            if deviation <= 2:
-                severity = "low"
-                description = f"Slightly over quota by {deviation} units"
-            elif deviation <= 5:
-                severity = "medium"
-                description = f"Moderately over quota by {deviation} units"
-            else:
-                severity = "high"
-                description = f"Significantly over quota by {deviation} units"
+            description = f"{qualifier} over quota by {abs_deviation} units"
         else:
             deviation_type = "under_quota"
-            abs_deviation = abs(deviation)
-            if abs_deviation <= 2:
-                severity = "low"
-                description = f"Slightly under quota by {abs_deviation} units"
-            elif abs_deviation <= 5:
-                severity = "medium"
-                description = f"Moderately under quota by {abs_deviation} units"
-            else:
-                severity = "high"
-                description = f"Significantly under quota by {abs_deviation} units"
+            description = f"{qualifier} under quota by {abs_deviation} units"
 
         return DeviationFlag(
             employee_name=employee_name,
@@ -1194,6 +1446,7 @@ class DataManager:
         year, month = map(int, month_key.split("-"))
         today = date.today()
 
+        # Clear the stored (already normalized) schedule in place
         schedule = self.get_schedule(month_key)
 
         if not schedule:
@@ -1208,27 +1461,27 @@ class DataManager:
 
         # Iterate through all dates in the schedule
         for date_str, day_schedule in schedule.items():
-            # Robust date parsing to handle both zero-padded and non-zero-padded months
             try:
-                parts = date_str.split("-")
-                if len(parts) == 3:
-                    year = int(parts[0])
-                    month = int(parts[1])
-                    day = int(parts[2])
-                    schedule_date = date(year, month, day)
-                else:
-                    logging.error(f"Invalid date format: {date_str}")
+                schedule_date = date.fromisoformat(date_str)
+            except ValueError:
+                # Robust date parsing to handle non-zero-padded months and days
+                try:
+                    parts = date_str.split("-")
+                    if len(parts) == 3:
+                        year = int(parts[0])
+                        month = int(parts[1])
+                        day = int(parts[2])
+                        schedule_date = date(year, month, day)
+                    else:
+                        logging.error(f"Invalid date format: {date_str}")
+                        continue
+                except (ValueError, IndexError) as e:
+                    logging.error(f"Failed to parse date {date_str}: {e}")
                     continue
-            except (ValueError, IndexError) as e:
-                logging.error(f"Failed to parse date {date_str}: {e}")
-                continue
 
             # Only clear future dates
             if schedule_date > today:
                 # Check if there are assignments to clear
-                day_shift = day_schedule.get("day_shift")
-                night_shift = day_schedule.get("night_shift")
-
                 day_shift_info = day_schedule.get("day_shift")
                 night_shift_info = day_schedule.get("night_shift")
                 has_assignment = False
@@ -1239,14 +1492,16 @@ class DataManager:
 
                 if has_assignment:
                     # Clear the assignments for the future date
-                    schedule[date_str]["day_shift"] = None
-                    schedule[date_str]["night_shift"] = None
+                    day_schedule["day_shift"] = None
+                    day_schedule["night_shift"] = None
                     cleared_count += 1
                     affected_dates.append(date_str)
 
         # Save the updated schedule
         if cleared_count > 0:
-            self.save_schedule_with_statistics(month_key, schedule)
+            self._shift_index.pop(month_key, None)
+            self._revision += 1
+            self._save_statistics(month_key)
             return {
                 "cleared_count": cleared_count,
                 "affected_dates": affected_dates,
@@ -1259,18 +1514,17 @@ class DataManager:
                 "message": "No future schedule assignments to clear",
             }
 
-    def get_team_stats(self, month_key: str) -> Dict[str, Any]:
+    def get_team_stats(
+        self,
+        month_key: str,
+        emp_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
         """Get team-level statistics with bucket information and deviation flags"""
-        emp_stats = self.calculate_employee_stats(month_key)
-
-        high_exp_employees = [
-            s for s in emp_stats.values() if s["experience"] == "High"
-        ]
-        low_exp_employees = [s for s in emp_stats.values() if s["experience"] == "Low"]
+        if emp_stats is None:
+            emp_stats = self.calculate_employee_stats(month_key)
 
         # Get bucket targets
-        year, month = map(int, month_key.split("-"))
-        days_in_month = calendar.monthrange(year, month)[1]
+        days_in_month = _parse_month_key(month_key)[2]
 
         bucket_targets = {}
         buckets = self.get_experience_buckets()
@@ -1278,67 +1532,66 @@ class DataManager:
             target = bucket.target_shifts.get(str(days_in_month), 0)
             bucket_targets[exp_level] = target
 
-        # Collect deviation flags
-        deviation_flags = []
+        # Aggregate employee stats in a single pass
+        high_count = low_count = 0
+        high_shifts = low_shifts = total_shifts = total_quota = 0
+        quota_violations = 0
+        over_quota = []
+        under_quota = []
+        deviation_flags = []  # Already plain dicts in emp_stats
+        flags_by_severity = {"high": [], "medium": [], "low": []}
         for emp_stat in emp_stats.values():
-            if emp_stat["deviation_flag"]:
-                deviation_flags.append(
-                    asdict(emp_stat["deviation_flag"])
-                    if hasattr(emp_stat["deviation_flag"], "__dataclass_fields__")
-                    else emp_stat["deviation_flag"]
-                )
+            shifts = emp_stat["total_shifts"]
+            total_shifts += shifts
+            total_quota += emp_stat["quota"]
+            if emp_stat["experience"] == "High":
+                high_count += 1
+                high_shifts += shifts
+            elif emp_stat["experience"] == "Low":
+                low_count += 1
+                low_shifts += shifts
+
+            deviation = emp_stat["quota_deviation"]
+            if deviation > 0:
+                over_quota.append(emp_stat["name"])
+            elif deviation < 0:
+                under_quota.append(emp_stat["name"])
+            if deviation != 0:
+                quota_violations += 1
+
+            flag = emp_stat["deviation_flag"]
+            if flag:
+                deviation_flags.append(flag)
+                severity_list = flags_by_severity.get(flag["severity"])
+                if severity_list is not None:
+                    severity_list.append(flag)
 
         # Add manual assignment stats
-        manual_count = 0
-        schedule = self.get_schedule(month_key)
-        for date_data in schedule.values():
-            for shift_type in ["day_shift", "night_shift"]:
-                shift_info = date_data.get(shift_type)
-                if (
-                    shift_info
-                    and isinstance(shift_info, dict)
-                    and shift_info.get("is_manual")
-                ):
-                    manual_count += 1
+        manual_count = sum(
+            len(emp_shifts["manual"])
+            for emp_shifts in self._get_shift_index(month_key).values()
+        )
 
         return {
             "total_employees": len(emp_stats),
-            "high_experience_count": len(high_exp_employees),
-            "low_experience_count": len(low_exp_employees),
-            "total_shifts_assigned": sum(s["total_shifts"] for s in emp_stats.values()),
-            "total_quota": sum(s["quota"] for s in emp_stats.values()),
-            "high_exp_shifts": sum(s["total_shifts"] for s in high_exp_employees),
-            "low_exp_shifts": sum(s["total_shifts"] for s in low_exp_employees),
+            "high_experience_count": high_count,
+            "low_experience_count": low_count,
+            "total_shifts_assigned": total_shifts,
+            "total_quota": total_quota,
+            "high_exp_shifts": high_shifts,
+            "low_exp_shifts": low_shifts,
             "bucket_targets": bucket_targets,
             "high_exp_target": bucket_targets.get("High", 0),
             "low_exp_target": bucket_targets.get("Low", 0),
-            "high_exp_target_deviation": sum(
-                s["total_shifts"] for s in high_exp_employees
-            )
-            - bucket_targets.get("High", 0),
-            "low_exp_target_deviation": sum(
-                s["total_shifts"] for s in low_exp_employees
-            )
-            - bucket_targets.get("Low", 0),
-            "quota_violations": len(
-                [s for s in emp_stats.values() if s["quota_deviation"] != 0]
-            ),
-            "over_quota_employees": [
-                s["name"] for s in emp_stats.values() if s["quota_deviation"] > 0
-            ],
-            "under_quota_employees": [
-                s["name"] for s in emp_stats.values() if s["quota_deviation"] < 0
-            ],
+            "high_exp_target_deviation": high_shifts - bucket_targets.get("High", 0),
+            "low_exp_target_deviation": low_shifts - bucket_targets.get("Low", 0),
+            "quota_violations": quota_violations,
+            "over_quota_employees": over_quota,
+            "under_quota_employees": under_quota,
             "deviation_flags": deviation_flags,
-            "high_severity_deviations": [
-                f for f in deviation_flags if f["severity"] == "high"
-            ],
-            "medium_severity_deviations": [
-                f for f in deviation_flags if f["severity"] == "medium"
-            ],
-            "low_severity_deviations": [
-                f for f in deviation_flags if f["severity"] == "low"
-            ],
+            "high_severity_deviations": flags_by_severity["high"],
+            "medium_severity_deviations": flags_by_severity["medium"],
+            "low_severity_deviations": flags_by_severity["low"],
             "manual_assignments": manual_count,
         }
 
@@ -1346,9 +1599,12 @@ class DataManager:
         self, month_key: str, date_str: str, shift_type: str
     ) -> bool:
         """Check if assignment is manual"""
-        schedule = self.get_schedule(month_key)
-        day_data = schedule.get(date_str, {})
-        shift_info = day_data.get(shift_type)
-        if isinstance(shift_info, dict):
-            return shift_info.get("is_manual", False)
-        return False
+        shift_info = (
+            self.data.get("schedules", {})
+            .get(month_key, {})
+            .get(date_str, {})
+            .get(shift_type)
+        )
+        if shift_info is None or isinstance(shift_info, int):
+            return False
+        return shift_info.get("is_manual", False)
@@ -6,10 +6,15 @@ with comprehensive error handling and logging.
 """
 
 import sys
+import atexit
+import importlib.util
 import logging
+import queue
 import traceback
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 from tkinter import messagebox
 
 # Add src directory to path for imports
@@ -18,21 +23,37 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from shift_scheduler.data_manager import DataManager
 from shift_scheduler.scheduler_logic import ShiftScheduler
 from shift_scheduler.ui import MainWindow
-from shift_scheduler.reporting import ExportManager
+
+_log_listener: Optional[QueueListener] = None
 
 
 def setup_logging():
     """Setup application logging"""
+    global _log_listener
+    if _log_listener is not None:
+        # Already configured; adding handlers again would duplicate every record
+        return logging.getLogger(__name__)
+
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
 
     log_file = log_dir / f"shift_scheduler_{datetime.now().strftime('%Y%m%d')}.log"
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.FileHandler(log_file), logging.StreamHandler(sys.stdout)],
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
+    handlers = [logging.FileHandler(log_file), logging.StreamHandler(sys.stdout)]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # File and console writes happen on the listener thread, not the GUI thread
+    log_queue = queue.Queue(-1)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+    _log_listener = QueueListener(log_queue, *handlers)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 
     return logging.getLogger(__name__)
 
@@ -47,13 +68,12 @@ def check_dependencies():
         "PIL",  # Pillow
     ]
 
-    missing_modules = []
-
-    for module in required_modules:
-        try:
-            __import__(module)
-        except ImportError:
-            missing_modules.append(module)
+    # Only locate each module; importing pandas/reportlab here is slow
+    missing_modules = [
+        module
+        for module in required_modules
+        if importlib.util.find_spec(module) is None
+    ]
 
     if missing_modules:
         error_msg = f"Missing required dependencies: {', '.join(missing_modules)}\n"
@@ -92,7 +112,6 @@ class ShiftSchedulerApp:
         self.logger = logging.getLogger(__name__)
         self.data_manager = None
         self.scheduler = None
-        self.export_manager = None
         self.main_window = None
 
     def initialize(self):
@@ -126,10 +145,6 @@ class ShiftSchedulerApp:
             self.scheduler = ShiftScheduler(self.data_manager)
             self.logger.info("Scheduler initialized")
 
-            # Initialize export manager
-            self.export_manager = ExportManager(self.data_manager)
-            self.logger.info("Export manager initialized")
-
             return True
 
         except Exception as e:
@@ -151,9 +166,6 @@ class ShiftSchedulerApp:
                 data_manager=self.data_manager, scheduler=self.scheduler
             )
 
-            # The export manager can still be assigned here as it's not used in the UI's initial build
-            self.main_window.export_manager = self.export_manager
-
             # Start the GUI
             self.main_window.mainloop()
 
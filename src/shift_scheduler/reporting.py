@@ -15,17 +15,274 @@ from reportlab.platypus import (
     Paragraph,
     Spacer,
     PageBreak,
+    Flowable,
 )
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch
-from datetime import datetime, date
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from datetime import datetime
 import calendar
-from pathlib import Path
-from typing import Dict, List, Optional, Any
+import csv
+import io
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib.util import find_spec
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 import logging
+from xml.sax.saxutils import escape
+
+from .data_manager import DataManager, Employee, _parse_month_key
+from .scheduler_logic import ScheduleMethod, ScheduleResult
+
+# Calendar cell text matches the "Normal" paragraph style: font size,
+# leading and usable width inside the cell padding
+_CALENDAR_FONT_SIZE = 10
+_CALENDAR_LEADING = 12
+_CALENDAR_TEXT_WIDTH = 1.2 * inch - 12
+
+# xlsxwriter writes workbooks faster than openpyxl; it is an optional extra
+_EXCEL_ENGINE = "xlsxwriter" if find_spec("xlsxwriter") else "openpyxl"
+
+# Table styles are identical for every export, so they are built once
+_CALENDAR_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 10),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+        ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+        ("FONTSIZE", (0, 1), (-1, -1), 8),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ]
+)
+
+_LEGEND_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("FONTSIZE", (0, 0), (-1, -1), 10),
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+    ]
+)
+
+
+class _CalendarCell(Flowable):
+    """Calendar cell drawn as a bold day number over plain lines.
+
+    Lays out exactly like a "Normal" Paragraph of the same lines, without
+    parsing markup or running the wrap algorithm.
+    """
+
+    def __init__(self, lines: List[str]):
+        super().__init__()
+        self.lines = lines
+
+    def wrap(self, availWidth, availHeight):
+        self.width = availWidth
+        self.height = len(self.lines) * _CALENDAR_LEADING
+        return self.width, self.height
+
+    def draw(self):
+        canvas = self.canv
+        y = self.height - _CALENDAR_FONT_SIZE
+        canvas.setFont("Helvetica-Bold", _CALENDAR_FONT_SIZE)
+        canvas.drawString(0, y, self.lines[0])
+        canvas.setFont("Helvetica", _CALENDAR_FONT_SIZE)
+        for line in self.lines[1:]:
+            y -= _CALENDAR_LEADING
+            canvas.drawString(0, y, line)
+
+
+# Shared by the team summary and deviation summary tables
+_SUMMARY_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+    ]
+)
+
+_OPTIMIZATION_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightblue),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("FONTSIZE", (0, 0), (-1, -1), 10),
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+    ]
+)
+
+# Base commands for the employee table; per-row severity colours are appended
+_EMPLOYEE_TABLE_COMMANDS = (
+    ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("GRID", (0, 0), (-1, -1), 1, colors.black),
+    ("FONTSIZE", (0, 0), (-1, -1), 8),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+)
+
+# Employee table row background per deviation severity (others stay white)
+_SEVERITY_COLORS = {
+    "high": colors.lightcoral,
+    "medium": colors.orange,
+    "low": colors.lightyellow,
+}
+
+
+def _solver_method(schedule_result: ScheduleResult) -> str:
+    """Label of the solver that produced a schedule result"""
+    if schedule_result.method is not None:
+        return schedule_result.method.value
+    # Results built without a method only mention the solver in their message
+    if ScheduleMethod.CP_SAT.value in schedule_result.message:
+        return ScheduleMethod.CP_SAT.value
+    return ScheduleMethod.BACKTRACKING.value
+
+
+def _format_opt_info(schedule_result: Optional[ScheduleResult]) -> str:
+    """Optimization block of the dashboard summary, empty without a result"""
+    if not schedule_result:
+        return ""
+    status = "SUCCESS" if schedule_result.success else "FAILED"
+    return "\n".join(
+        (
+            "Optimization Results:",
+            f"• Method: {_solver_method(schedule_result)}",
+            f"• Status: {status}",
+            f"• Constraint Violations: {len(schedule_result.violations)}",
+            f"• Message: {schedule_result.message}",
+        )
+    )
+
+
+def _severity_counts(team_stats: Dict[str, Any]) -> Tuple[int, int, int]:
+    """(high, medium, low) deviation flag counts from team stats"""
+    # The flags are already split by severity in one pass over the employees
+    return (
+        len(team_stats.get("high_severity_deviations", ())),
+        len(team_stats.get("medium_severity_deviations", ())),
+        len(team_stats.get("low_severity_deviations", ())),
+    )
+
+
+# Pulls (employee name, description) out of a deviation flag dict
+_flag_name_description = itemgetter("employee_name", "description")
+
+# Lowercase month names for export filenames, indexed like calendar.month_name
+_MONTH_NAME_LOWER = tuple(name.lower() for name in calendar.month_name)
+
+# Fixed body of the dashboard summary, filled from team stats and violations
+_SUMMARY_BODY_TEMPLATE = """Team Overview:
+• Total Employees: {total_employees}
+• High Experience: {high_experience_count}
+• Low Experience: {low_experience_count}
+
+Shift Distribution:
+• Total Shifts: {total_shifts_assigned}
+• High Exp Shifts: {high_exp_shifts}
+• Low Exp Shifts: {low_exp_shifts}
+
+Experience Bucket Targets:
+• High Exp Target: {high_exp_target}
+• Low Exp Target: {low_exp_target}
+• High Exp Deviation: {high_exp_target_deviation}
+• Low Exp Deviation: {low_exp_target_deviation}
+
+Deviation Flags:
+• High Severity: {high_severity} (Critical quota violations)
+• Medium Severity: {medium_severity} (Moderate deviations)
+• Low Severity: {low_severity} (Minor adjustments)
+
+Issues:
+• Quota Violations: {total_quota_violations}
+• Unassigned Shifts: {total_unassigned_shifts}
+• Over Quota: {employees_over_quota}
+• Under Quota: {employees_under_quota}"""
+
+_SUMMARY_DEFAULTS = {
+    "high_exp_target": "N/A",
+    "low_exp_target": "N/A",
+    "high_exp_target_deviation": "N/A",
+    "low_exp_target_deviation": "N/A",
+}
+
+# Column layout shared by the schedule sheet and the CSV export
+_SCHEDULE_COLUMNS = (
+    "Date",
+    "Day",
+    "Day_Shift_Employee",
+    "Day_Shift_Experience",
+    "Night_Shift_Employee",
+    "Night_Shift_Experience",
+)
+
+
+# Column layout of the statistics sheet
+_STATISTICS_COLUMNS = (
+    "Employee",
+    "Experience",
+    "Day_Shifts",
+    "Night_Shifts",
+    "Total_Shifts",
+    "Quota",
+    "Quota_Deviation",
+    "Absences",
+    "Deviation_Type",
+    "Deviation_Severity",
+    "Deviation_Description",
+)
 
-from .data_manager import DataManager, Employee
-from .scheduler_logic import ScheduleResult
+
+def _get_shift_employee_id(shift_info: Any) -> Optional[int]:
+    """Get employee ID from shift info, handling old (int) and new (dict) formats"""
+    if isinstance(shift_info, dict):
+        return shift_info.get("employee_id")
+    return shift_info
+
+
+@lru_cache(maxsize=None)
+def _get_stylesheet() -> StyleSheet1:
+    """Sample stylesheet plus the custom report styles, built once and shared"""
+    styles = getSampleStyleSheet()
+    styles.add(
+        ParagraphStyle(
+            name="CustomTitle",
+            parent=styles["Heading1"],
+            fontSize=18,
+            spaceAfter=30,
+            alignment=1,  # Center alignment
+        )
+    )
+
+    styles.add(
+        ParagraphStyle(
+            name="CustomHeading",
+            parent=styles["Heading2"],
+            fontSize=14,
+            spaceAfter=12,
+        )
+    )
+    return styles
+
+
+@dataclass(slots=True)
+class _ExportContext:
+    """Data shared by every format of one export"""
+
+    schedule: Dict[str, Dict[str, Any]]
+    emp_map: Dict[int, Employee]
+    emp_stats: Dict[str, Dict[str, Any]]
+    team_stats: Dict[str, Any]
 
 
 class ReportGenerator:
@@ -33,29 +290,28 @@ class ReportGenerator:
 
     def __init__(self, data_manager: DataManager):
         self.data_manager = data_manager
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-
-    def _setup_custom_styles(self):
-        """Setup custom report styles"""
-        self.styles.add(
-            ParagraphStyle(
-                name="CustomTitle",
-                parent=self.styles["Heading1"],
-                fontSize=18,
-                spaceAfter=30,
-                alignment=1,  # Center alignment
-            )
-        )
+        self.styles = _get_stylesheet()
+        # month_key -> (schedule_result, data revision, emp_stats, team_stats)
+        self._stats_cache: Dict[str, tuple] = {}
+        self._summary_cache: Dict[str, tuple] = {}
 
-        self.styles.add(
-            ParagraphStyle(
-                name="CustomHeading",
-                parent=self.styles["Heading2"],
-                fontSize=14,
-                spaceAfter=12,
-            )
-        )
+    def _get_employee_map(self) -> Dict[int, Employee]:
+        """Snapshot of all employees by ID, built once per export"""
+        return {
+            emp.id: emp for emp in self.data_manager.iter_employees(active_only=False)
+        }
+
+    def _build_context(
+        self, year: int, month: int, schedule_result: Optional[ScheduleResult] = None
+    ) -> _ExportContext:
+        """Gather the schedule, employees and statistics an export needs"""
+        month_key = f"{year}-{month:02d}"
+        if schedule_result:
+            schedule = schedule_result.schedule
+        else:
+            schedule = self.data_manager.get_schedule(month_key)
+        emp_stats, team_stats = self._get_stats(month_key, schedule_result)
+        return _ExportContext(schedule, self._get_employee_map(), emp_stats, team_stats)
 
     def export_calendar_pdf(
         self,
@@ -63,9 +319,13 @@ class ReportGenerator:
         month: int,
         output_path: str,
         schedule_result: Optional["ScheduleResult"] = None,
+        context: Optional[_ExportContext] = None,
     ) -> bool:
         """Export monthly calendar to PDF with deviation tracking"""
         try:
+            if context is None:
+                context = self._build_context(year, month, schedule_result)
+
             doc = SimpleDocTemplate(
                 output_path,
                 pagesize=landscape(A4),
@@ -97,7 +357,9 @@ class ReportGenerator:
                 story.append(Spacer(1, 20))
 
             # Calendar table
-            calendar_table = self._create_calendar_table(year, month, schedule_result)
+            calendar_table = self._create_calendar_table(
+                year, month, context.schedule, context.emp_map
+            )
             story.append(calendar_table)
 
             # Legend
@@ -105,10 +367,11 @@ class ReportGenerator:
             legend = self._create_legend()
             story.append(legend)
 
-            # Statistics
+            # Statistics (flowables are created per story: ReportLab marks a
+            # postponed flowable, so a shared Spacer/PageBreak breaks layout)
             story.append(PageBreak())
             stats_content = self._create_statistics_content(
-                year, month, schedule_result
+                context.emp_stats, context.team_stats
             )
             story.extend(stats_content)
 
@@ -120,16 +383,13 @@ class ReportGenerator:
             return False
 
     def _create_calendar_table(
-        self, year: int, month: int, schedule_result: Optional[ScheduleResult] = None
+        self,
+        year: int,
+        month: int,
+        schedule: Dict[str, Dict[str, Any]],
+        emp_map: Dict[int, Employee],
     ) -> Table:
         """Create calendar table for PDF"""
-        # Get schedule data
-        month_key = f"{year}-{month:02d}"
-        if schedule_result:
-            schedule = schedule_result.schedule
-        else:
-            schedule = self.data_manager.get_schedule(month_key)
-
         # Create calendar data
         cal = calendar.monthcalendar(year, month)
 
@@ -143,7 +403,7 @@ class ReportGenerator:
                     week_data.append("")
                 else:
                     cell_content = self._format_calendar_cell(
-                        year, month, day, schedule
+                        year, month, day, schedule, emp_map
                     )
                     week_data.append(cell_content)
             data.append(week_data)
@@ -154,22 +414,7 @@ class ReportGenerator:
         )
 
         # Table style
-        table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 10),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                    ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                    ("FONTSIZE", (0, 1), (-1, -1), 8),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ]
-            )
-        )
+        table.setStyle(_CALENDAR_TABLE_STYLE)
 
         return table
 
@@ -179,39 +424,47 @@ class ReportGenerator:
         month: int,
         day: int,
         schedule: Dict[str, Dict[str, Optional[int]]],
-    ) -> str:
+        emp_map: Dict[int, Employee],
+    ) -> Flowable:
         """Format individual calendar cell content"""
-        date_obj = date(year, month, day)
-        date_str = date_obj.strftime("%Y-%m-%d")
+        date_str = f"{year:04d}-{month:02d}-{day:02d}"
         day_data = schedule.get(date_str, {})
 
-        content = f"<b>{day}</b><br/>"
+        lines = [str(day)]
 
         # Day shift
-        day_emp_id = day_data.get("day_shift")
+        day_emp_id = _get_shift_employee_id(day_data.get("day_shift"))
         if day_emp_id:
-            emp = self.data_manager.get_employee_by_id(day_emp_id)
+            emp = emp_map.get(day_emp_id)
             if emp:
                 exp_badge = "★" if emp.experience == "High" else "○"
-                content += f"Day: {exp_badge}{emp.name}<br/>"
+                lines.append(f"Day: {exp_badge}{emp.name}")
             else:
-                content += "Day: Unknown<br/>"
+                lines.append("Day: Unknown")
         else:
-            content += "Day: ---<br/>"
+            lines.append("Day: ---")
 
         # Night shift
-        night_emp_id = day_data.get("night_shift")
+        night_emp_id = _get_shift_employee_id(day_data.get("night_shift"))
         if night_emp_id:
-            emp = self.data_manager.get_employee_by_id(night_emp_id)
+            emp = emp_map.get(night_emp_id)
             if emp:
                 exp_badge = "★" if emp.experience == "High" else "○"
-                content += f"Night: {exp_badge}{emp.name}"
+                lines.append(f"Night: {exp_badge}{emp.name}")
             else:
-                content += "Night: Unknown"
+                lines.append("Night: Unknown")
         else:
-            content += "Night: ---"
-
-        return Paragraph(content, self.styles["Normal"])
+            lines.append("Night: ---")
+
+        # Direct drawing skips Paragraph parsing and layout; only names too long
+        # for the cell need a Paragraph so they wrap instead of overflowing
+        if any(
+            stringWidth(line, "Helvetica", _CALENDAR_FONT_SIZE) > _CALENDAR_TEXT_WIDTH
+            for line in lines[1:]
+        ):
+            content = f"<b>{lines[0]}</b><br/>" + "<br/>".join(map(escape, lines[1:]))
+            return Paragraph(content, self.styles["Normal"])
+        return _CalendarCell(lines)
 
     def _create_legend(self) -> Table:
         """Create legend for PDF"""
@@ -223,48 +476,43 @@ class ReportGenerator:
         ]
 
         legend_table = Table(legend_data, colWidths=[3 * inch])
-        legend_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 10),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                ]
-            )
-        )
+        legend_table.setStyle(_LEGEND_TABLE_STYLE)
 
         return legend_table
 
     def _create_statistics_content(
-        self, year: int, month: int, schedule_result: Optional[ScheduleResult] = None
+        self, emp_stats: Dict[str, Dict[str, Any]], team_stats: Dict[str, Any]
     ) -> List:
         """Create statistics content for PDF with deviation tracking"""
         content = []
-        month_key = f"{year}-{month:02d}"
 
         # Title
         title = Paragraph("Schedule Statistics", self.styles["CustomTitle"])
         content.append(title)
         content.append(Spacer(1, 20))
 
-        # Get statistics from ScheduleResult or calculate
-        if schedule_result and schedule_result.statistics:
-            emp_stats = schedule_result.statistics
-            team_stats = self._calculate_team_stats_from_emp_stats(emp_stats, month_key)
-        else:
-            emp_stats = self.data_manager.calculate_employee_stats(month_key)
-            team_stats = self.data_manager.get_team_stats(month_key)
-
         # Team summary with experience buckets
         team_heading = Paragraph("Team Summary", self.styles["CustomHeading"])
         content.append(team_heading)
 
-        # Get bucket information
-        buckets = self.data_manager.get_experience_buckets()
-        year_val, month_val = map(int, month_key.split("-"))
-        days_in_month = calendar.monthrange(year_val, month_val)[1]
+        # Add bucket targets if available
+        bucket_targets = team_stats.get("bucket_targets")
+        bucket_rows = (
+            [
+                ["High Exp Target", str(bucket_targets.get("High", 0))],
+                ["Low Exp Target", str(bucket_targets.get("Low", 0))],
+                [
+                    "High Exp Deviation",
+                    f"{team_stats.get('high_exp_target_deviation', 0):+d}",
+                ],
+                [
+                    "Low Exp Deviation",
+                    f"{team_stats.get('low_exp_target_deviation', 0):+d}",
+                ],
+            ]
+            if bucket_targets is not None
+            else []
+        )
 
         team_data = [
             ["Metric", "Value"],
@@ -274,39 +522,11 @@ class ReportGenerator:
             ["Total Shifts Assigned", str(team_stats["total_shifts_assigned"])],
             ["Total Quota", str(team_stats["total_quota"])],
             ["Quota Violations", str(team_stats["quota_violations"])],
+            *bucket_rows,
         ]
 
-        # Add bucket targets if available
-        if "bucket_targets" in team_stats:
-            high_target = team_stats["bucket_targets"].get("High", 0)
-            low_target = team_stats["bucket_targets"].get("Low", 0)
-            team_data.extend(
-                [
-                    ["High Exp Target", str(high_target)],
-                    ["Low Exp Target", str(low_target)],
-                    [
-                        "High Exp Deviation",
-                        f"{team_stats.get('high_exp_target_deviation', 0):+d}",
-                    ],
-                    [
-                        "Low Exp Deviation",
-                        f"{team_stats.get('low_exp_target_deviation', 0):+d}",
-                    ],
-                ]
-            )
-
         team_table = Table(team_data, colWidths=[3 * inch, 2 * inch])
-        team_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                ]
-            )
-        )
+        team_table.setStyle(_SUMMARY_TABLE_STYLE)
 
         content.append(team_table)
         content.append(Spacer(1, 20))
@@ -362,36 +582,17 @@ class ReportGenerator:
                 2.0 * inch,
             ],
         )
-        emp_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                    ("FONTSIZE", (0, 0), (-1, -1), 8),
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ]
-            )
-        )
+        emp_styles = list(_EMPLOYEE_TABLE_COMMANDS)
 
         # Color code deviations with severity-based coloring
-        for i, (emp_name, stats) in enumerate(emp_stats.items(), 1):
-            if stats.get("deviation_flag"):
-                flag = stats["deviation_flag"]
-                if flag["severity"] == "high":
-                    bg_color = colors.lightcoral
-                elif flag["severity"] == "medium":
-                    bg_color = colors.orange
-                elif flag["severity"] == "low":
-                    bg_color = colors.lightyellow
-                else:
-                    bg_color = colors.white
+        for i, stats in enumerate(emp_stats.values(), 1):
+            flag = stats.get("deviation_flag")
+            bg_color = _SEVERITY_COLORS.get(flag["severity"]) if flag else None
+            if bg_color is not None:
+                emp_styles.append(("BACKGROUND", (0, i), (-1, i), bg_color))
 
-                emp_table.setStyle(
-                    TableStyle([("BACKGROUND", (0, i), (-1, i), bg_color)])
-                )
+        # One style for the whole table instead of a setStyle call per row
+        emp_table.setStyle(TableStyle(emp_styles))
 
         content.append(emp_table)
 
@@ -400,40 +601,18 @@ class ReportGenerator:
         deviation_heading = Paragraph("Deviation Summary", self.styles["CustomHeading"])
         content.append(deviation_heading)
 
-        team_stats = self.data_manager.get_team_stats(month_key)
+        high, medium, low = _severity_counts(team_stats)
         deviation_data = [
             ["Severity", "Count", "Description"],
-            [
-                "High",
-                str(len(team_stats.get("high_severity_deviations", []))),
-                "Significant quota violations",
-            ],
-            [
-                "Medium",
-                str(len(team_stats.get("medium_severity_deviations", []))),
-                "Moderate quota deviations",
-            ],
-            [
-                "Low",
-                str(len(team_stats.get("low_severity_deviations", []))),
-                "Minor quota adjustments",
-            ],
+            ["High", str(high), "Significant quota violations"],
+            ["Medium", str(medium), "Moderate quota deviations"],
+            ["Low", str(low), "Minor quota adjustments"],
         ]
 
         deviation_table = Table(
             deviation_data, colWidths=[1 * inch, 1 * inch, 3 * inch]
         )
-        deviation_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                ]
-            )
-        )
+        deviation_table.setStyle(_SUMMARY_TABLE_STYLE)
 
         content.append(deviation_table)
 
@@ -446,41 +625,51 @@ class ReportGenerator:
             ["Status", "Success" if schedule_result.success else "Failed"],
             [
                 "Method",
-                "CP-SAT" if "CP-SAT" in schedule_result.message else "Backtracking",
+                _solver_method(schedule_result),
             ],
             ["Violations", str(len(schedule_result.violations))],
             ["Message", schedule_result.message],
         ]
 
         summary_table = Table(summary_data, colWidths=[2 * inch, 3 * inch])
-        summary_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.lightblue),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 10),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                ]
-            )
-        )
+        summary_table.setStyle(_OPTIMIZATION_TABLE_STYLE)
 
         return summary_table
 
+    def _get_stats(
+        self, month_key: str, schedule_result: Optional[ScheduleResult] = None
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any]]:
+        """Get (employee stats, team stats), reused across exports of one month"""
+        cached = self._stats_cache.get(month_key)
+        revision = self.data_manager.revision
+        if (
+            cached is not None
+            and cached[0] is schedule_result
+            and cached[1] == revision
+        ):
+            return cached[2], cached[3]
+
+        if schedule_result and schedule_result.statistics:
+            emp_stats = schedule_result.statistics
+            team_stats = self._calculate_team_stats_from_emp_stats(emp_stats, month_key)
+        else:
+            emp_stats = self.data_manager.calculate_employee_stats(month_key)
+            team_stats = self.data_manager.get_team_stats(month_key, emp_stats)
+
+        self._stats_cache[month_key] = (
+            schedule_result,
+            revision,
+            emp_stats,
+            team_stats,
+        )
+        return emp_stats, team_stats
+
     def _calculate_team_stats_from_emp_stats(
         self, emp_stats: Dict[str, Dict[str, Any]], month_key: str
     ) -> Dict[str, Any]:
         """Calculate team statistics from employee statistics"""
-        high_exp_employees = [
-            s for s in emp_stats.values() if s.get("experience") == "High"
-        ]
-        low_exp_employees = [
-            s for s in emp_stats.values() if s.get("experience") == "Low"
-        ]
-
         # Get bucket targets
-        year, month = map(int, month_key.split("-"))
-        days_in_month = calendar.monthrange(year, month)[1]
+        days_in_month = _parse_month_key(month_key)[2]
         buckets = self.data_manager.get_experience_buckets()
 
         bucket_targets = {}
@@ -488,67 +677,68 @@ class ReportGenerator:
             target = bucket.target_shifts.get(str(days_in_month), 0)
             bucket_targets[exp_level] = target
 
-        # Collect deviation flags
+        # Aggregate employee stats and collect deviation flags in a single pass
+        high_count = low_count = 0
+        high_shifts = low_shifts = total_shifts = total_quota = 0
+        quota_violations = 0
+        over_quota = []
+        under_quota = []
         deviation_flags = []
+        flags_by_severity = {"high": [], "medium": [], "low": []}
         for emp_stat in emp_stats.values():
-            if emp_stat.get("deviation_flag"):
-                flag = emp_stat["deviation_flag"]
-                deviation_flags.append(
-                    {
-                        "employee_name": emp_stat.get("name", ""),
-                        "deviation_type": flag["deviation_type"],
-                        "deviation_units": flag["deviation_units"],
-                        "severity": flag["severity"],
-                        "description": flag["description"],
-                    }
-                )
+            shifts = emp_stat.get("total_shifts", 0)
+            total_shifts += shifts
+            total_quota += emp_stat.get("quota", 0)
+            experience = emp_stat.get("experience")
+            if experience == "High":
+                high_count += 1
+                high_shifts += shifts
+            elif experience == "Low":
+                low_count += 1
+                low_shifts += shifts
+
+            deviation = emp_stat.get("quota_deviation", 0)
+            if deviation > 0:
+                over_quota.append(emp_stat.get("name", ""))
+            elif deviation < 0:
+                under_quota.append(emp_stat.get("name", ""))
+            if deviation != 0:
+                quota_violations += 1
+
+            flag = emp_stat.get("deviation_flag")
+            if flag:
+                flag_info = {
+                    "employee_name": emp_stat.get("name", ""),
+                    "deviation_type": flag["deviation_type"],
+                    "deviation_units": flag["deviation_units"],
+                    "severity": flag["severity"],
+                    "description": flag["description"],
+                }
+                deviation_flags.append(flag_info)
+                severity_list = flags_by_severity.get(flag["severity"])
+                if severity_list is not None:
+                    severity_list.append(flag_info)
 
         return {
             "total_employees": len(emp_stats),
-            "high_experience_count": len(high_exp_employees),
-            "low_experience_count": len(low_exp_employees),
-            "total_shifts_assigned": sum(
-                s.get("total_shifts", 0) for s in emp_stats.values()
-            ),
-            "total_quota": sum(s.get("quota", 0) for s in emp_stats.values()),
-            "high_exp_shifts": sum(
-                s.get("total_shifts", 0) for s in high_exp_employees
-            ),
-            "low_exp_shifts": sum(s.get("total_shifts", 0) for s in low_exp_employees),
+            "high_experience_count": high_count,
+            "low_experience_count": low_count,
+            "total_shifts_assigned": total_shifts,
+            "total_quota": total_quota,
+            "high_exp_shifts": high_shifts,
+            "low_exp_shifts": low_shifts,
             "bucket_targets": bucket_targets,
             "high_exp_target": bucket_targets.get("High", 0),
             "low_exp_target": bucket_targets.get("Low", 0),
-            "high_exp_target_deviation": sum(
-                s.get("total_shifts", 0) for s in high_exp_employees
-            )
-            - bucket_targets.get("High", 0),
-            "low_exp_target_deviation": sum(
-                s.get("total_shifts", 0) for s in low_exp_employees
-            )
-            - bucket_targets.get("Low", 0),
-            "quota_violations": len(
-                [s for s in emp_stats.values() if s.get("quota_deviation", 0) != 0]
-            ),
-            "over_quota_employees": [
-                s.get("name", "")
-                for s in emp_stats.values()
-                if s.get("quota_deviation", 0) > 0
-            ],
-            "under_quota_employees": [
-                s.get("name", "")
-                for s in emp_stats.values()
-                if s.get("quota_deviation", 0) < 0
-            ],
+            "high_exp_target_deviation": high_shifts - bucket_targets.get("High", 0),
+            "low_exp_target_deviation": low_shifts - bucket_targets.get("Low", 0),
+            "quota_violations": quota_violations,
+            "over_quota_employees": over_quota,
+            "under_quota_employees": under_quota,
             "deviation_flags": deviation_flags,
-            "high_severity_deviations": [
-                f for f in deviation_flags if f["severity"] == "high"
-            ],
-            "medium_severity_deviations": [
-                f for f in deviation_flags if f["severity"] == "medium"
-            ],
-            "low_severity_deviations": [
-                f for f in deviation_flags if f["severity"] == "low"
-            ],
+            "high_severity_deviations": flags_by_severity["high"],
+            "medium_severity_deviations": flags_by_severity["medium"],
+            "low_severity_deviations": flags_by_severity["low"],
         }
 
     def export_schedule_excel(
@@ -557,38 +747,36 @@ class ReportGenerator:
         month: int,
         output_path: str,
         schedule_result: Optional[ScheduleResult] = None,
+        context: Optional[_ExportContext] = None,
     ) -> bool:
         """Export schedule to Excel format with deviation tracking"""
         try:
-            month_key = f"{year}-{month:02d}"
+            if context is None:
+                context = self._build_context(year, month, schedule_result)
 
-            # Get schedule data
+            # Build every sheet first so a failure cannot leave a partial file
+            sheets = {
+                "Schedule": self._create_schedule_dataframe(
+                    year, month, context.schedule, context.emp_map
+                ),
+                # Statistics sheet with deviations
+                "Statistics": self._create_statistics_dataframe(context.emp_stats),
+                "Employees": self._create_employee_dataframe(),
+            }
             if schedule_result:
-                schedule = schedule_result.schedule
-            else:
-                schedule = self.data_manager.get_schedule(month_key)
+                sheets["Optimization"] = self._create_optimization_dataframe(
+                    schedule_result
+                )
 
             # Create Excel writer
-            with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-                # Schedule sheet
-                schedule_df = self._create_schedule_dataframe(year, month, schedule)
-                schedule_df.to_excel(writer, sheet_name="Schedule", index=False)
-
-                # Statistics sheet with deviations
-                stats_df = self._create_statistics_dataframe(month_key, schedule_result)
-                stats_df.to_excel(writer, sheet_name="Statistics", index=False)
-
-                # Employee details sheet
-                emp_df = self._create_employee_dataframe()
-                emp_df.to_excel(writer, sheet_name="Employees", index=False)
-
-                # Optimization sheet if available
-                if schedule_result:
-                    opt_df = self._create_optimization_dataframe(schedule_result)
-                    opt_df.to_excel(writer, sheet_name="Optimization", index=False)
+            with pd.ExcelWriter(output_path, engine=_EXCEL_ENGINE) as writer:
+                for sheet_name, df in sheets.items():
+                    df.to_excel(writer, sheet_name=sheet_name, index=False)
 
                 # Format worksheets
-                self._format_excel_worksheets(writer)
+                self._format_excel_worksheets(
+                    writer, self._get_column_widths(sheets["Schedule"])
+                )
 
             return True
 
@@ -596,43 +784,50 @@ class ReportGenerator:
             logging.error(f"Error exporting to Excel: {e}", exc_info=True)
             return False
 
-    def _create_schedule_dataframe(
-        self, year: int, month: int, schedule: Dict[str, Dict[str, Optional[int]]]
-    ) -> pd.DataFrame:
-        """Create schedule DataFrame for Excel export"""
-        data = []
-        days_in_month = calendar.monthrange(year, month)[1]
+    def _iter_schedule_rows(
+        self,
+        year: int,
+        month: int,
+        schedule: Dict[str, Dict[str, Optional[int]]],
+        emp_map: Dict[int, Employee],
+    ) -> Iterator[tuple]:
+        """Yield one row per day of the month, in _SCHEDULE_COLUMNS order"""
+        first_weekday, days_in_month = calendar.monthrange(year, month)
+        day_names = calendar.day_name
 
         for day in range(1, days_in_month + 1):
-            date_obj = date(year, month, day)
-            date_str = date_obj.strftime("%Y-%m-%d")
+            # Weekday follows from the month's first day; no per-day strftime
+            date_str = f"{year:04d}-{month:02d}-{day:02d}"
             day_data = schedule.get(date_str, {})
 
             # Get employee names
-            day_emp_id = day_data.get("day_shift")
-            night_emp_id = day_data.get("night_shift")
-
-            day_emp = (
-                self.data_manager.get_employee_by_id(day_emp_id) if day_emp_id else None
-            )
-            night_emp = (
-                self.data_manager.get_employee_by_id(night_emp_id)
-                if night_emp_id
-                else None
-            )
-
-            data.append(
-                {
-                    "Date": date_str,
-                    "Day": date_obj.strftime("%A"),
-                    "Day_Shift_Employee": day_emp.name if day_emp else "",
-                    "Day_Shift_Experience": day_emp.experience if day_emp else "",
-                    "Night_Shift_Employee": night_emp.name if night_emp else "",
-                    "Night_Shift_Experience": night_emp.experience if night_emp else "",
-                }
+            day_emp_id = _get_shift_employee_id(day_data.get("day_shift"))
+            night_emp_id = _get_shift_employee_id(day_data.get("night_shift"))
+
+            day_emp = emp_map.get(day_emp_id) if day_emp_id else None
+            night_emp = emp_map.get(night_emp_id) if night_emp_id else None
+
+            yield (
+                date_str,
+                day_names[(first_weekday + day - 1) % 7],
+                day_emp.name if day_emp else "",
+                day_emp.experience if day_emp else "",
+                night_emp.name if night_emp else "",
+                night_emp.experience if night_emp else "",
             )
 
-        return pd.DataFrame(data)
+    def _create_schedule_dataframe(
+        self,
+        year: int,
+        month: int,
+        schedule: Dict[str, Dict[str, Optional[int]]],
+        emp_map: Dict[int, Employee],
+    ) -> pd.DataFrame:
+        """Create schedule DataFrame for Excel export"""
+        return pd.DataFrame(
+            list(self._iter_schedule_rows(year, month, schedule, emp_map)),
+            columns=list(_SCHEDULE_COLUMNS),
+        )
 
     def _generate_violations_from_schedule_result(
         self, schedule_result: ScheduleResult
@@ -685,59 +880,43 @@ class ReportGenerator:
     ) -> pd.DataFrame:
         """Create optimization DataFrame for Excel export"""
         data = [
-            {"Metric": "Success", "Value": schedule_result.success},
-            {
-                "Metric": "Method",
-                "Value": (
-                    "CP-SAT" if "CP-SAT" in schedule_result.message else "Backtracking"
-                ),
-            },
-            {"Metric": "Violations Count", "Value": len(schedule_result.violations)},
-            {"Metric": "Message", "Value": schedule_result.message},
+            ("Success", schedule_result.success),
+            ("Method", _solver_method(schedule_result)),
+            ("Violations Count", len(schedule_result.violations)),
+            ("Message", schedule_result.message),
+            # Add violations if any (limit to first 10)
+            *(
+                (f"Violation {i}", violation)
+                for i, violation in enumerate(schedule_result.violations[:10], 1)
+            ),
         ]
 
-        # Add violations if any
-        for i, violation in enumerate(
-            schedule_result.violations[:10]
-        ):  # Limit to first 10
-            data.append({"Metric": f"Violation {i+1}", "Value": violation})
-
-        return pd.DataFrame(data)
+        return pd.DataFrame(data, columns=["Metric", "Value"])
 
     def _create_statistics_dataframe(
-        self, month_key: str, schedule_result: Optional[ScheduleResult] = None
+        self, emp_stats: Dict[str, Dict[str, Any]]
     ) -> pd.DataFrame:
         """Create statistics DataFrame for Excel export with deviation flags"""
-        if schedule_result and schedule_result.statistics:
-            emp_stats = schedule_result.statistics
-        else:
-            emp_stats = self.data_manager.calculate_employee_stats(month_key)
-
         data = []
         for emp_name, stats in emp_stats.items():
-            flag_info = {}
-            if stats.get("deviation_flag"):
-                flag = stats["deviation_flag"]
-                flag_info = {
-                    "Deviation_Type": flag["deviation_type"],
-                    "Deviation_Severity": flag["severity"],
-                    "Deviation_Description": flag["description"],
-                }
-
-            row = {
-                "Employee": emp_name,
-                "Experience": stats["experience"],
-                "Day_Shifts": stats["day_shifts"],
-                "Night_Shifts": stats["night_shifts"],
-                "Total_Shifts": stats["total_shifts"],
-                "Quota": stats["quota"],
-                "Quota_Deviation": stats["quota_deviation"],
-                "Absences": stats["absences"],
-            }
-            row.update(flag_info)
-            data.append(row)
+            flag = stats.get("deviation_flag")
+            data.append(
+                (
+                    emp_name,
+                    stats["experience"],
+                    stats["day_shifts"],
+                    stats["night_shifts"],
+                    stats["total_shifts"],
+                    stats["quota"],
+                    stats["quota_deviation"],
+                    stats["absences"],
+                    flag["deviation_type"] if flag else None,
+                    flag["severity"] if flag else None,
+                    flag["description"] if flag else None,
+                )
+            )
 
-        return pd.DataFrame(data)
+        return pd.DataFrame(data, columns=list(_STATISTICS_COLUMNS))
 
     def _create_employee_dataframe(self) -> pd.DataFrame:
         """Create employee DataFrame for Excel export"""
@@ -756,11 +935,36 @@ class ReportGenerator:
 
         return pd.DataFrame(data)
 
-    def _format_excel_worksheets(self, writer):
+    @staticmethod
+    def _get_column_widths(df: pd.DataFrame) -> List[int]:
+        """Excel column widths fitted to the longest header or value per column"""
+        return [
+            min(
+                max(len(str(column)), df[column].astype(str).str.len().max()) + 2,
+                50,
+            )
+            for column in df.columns
+        ]
+
+    def _format_excel_worksheets(self, writer, schedule_widths: List[int]):
         """Format Excel worksheets"""
+        if writer.engine == "xlsxwriter":
+            schedule_ws = writer.sheets["Schedule"]
+
+            # Formats are shared by reference; rewrite the header cells with one
+            header_format = writer.book.add_format(
+                {"bold": True, "bg_color": "#366092", "font_color": "#FFFFFF"}
+            )
+            for i, (column, width) in enumerate(
+                zip(_SCHEDULE_COLUMNS, schedule_widths)
+            ):
+                schedule_ws.write(0, i, column, header_format)
+                schedule_ws.set_column(i, i, width)
+            return
+
         try:
             from openpyxl.styles import PatternFill, Font
-            from openpyxl.utils.dataframe import dataframe_to_rows
+            from openpyxl.utils import get_column_letter
 
             # Format Schedule sheet
             schedule_ws = writer.sheets["Schedule"]
@@ -775,34 +979,36 @@ class ReportGenerator:
                 cell.fill = header_fill
                 cell.font = header_font
 
-            # Auto-adjust column widths
-            for column in schedule_ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                schedule_ws.column_dimensions[column_letter].width = adjusted_width
+            # Column widths come from the DataFrame, not a walk over every cell
+            for i, width in enumerate(schedule_widths, 1):
+                schedule_ws.column_dimensions[get_column_letter(i)].width = width
 
         except ImportError:
             # openpyxl styling not available
             pass
 
-    def export_schedule_csv(self, year: int, month: int, output_path: str) -> bool:
+    def export_schedule_csv(
+        self,
+        year: int,
+        month: int,
+        output_path: str,
+        context: Optional[_ExportContext] = None,
+    ) -> bool:
         """Export schedule to CSV format"""
         try:
-            month_key = f"{year}-{month:02d}"
-            schedule = self.data_manager.get_schedule(month_key)
-
-            # Create schedule DataFrame
-            schedule_df = self._create_schedule_dataframe(year, month, schedule)
+            if context is None:
+                month_key = f"{year}-{month:02d}"
+                schedule = self.data_manager.get_schedule(month_key)
+                emp_map = self._get_employee_map()
+            else:
+                schedule, emp_map = context.schedule, context.emp_map
 
-            # Export to CSV
-            schedule_df.to_csv(output_path, index=False)
+            # Rows go straight to the file; a DataFrame adds nothing here
+            rows = self._iter_schedule_rows(year, month, schedule, emp_map)
+            with open(output_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f, lineterminator=os.linesep)
+                writer.writerow(_SCHEDULE_COLUMNS)
+                writer.writerows(rows)
 
             return True
 
@@ -810,11 +1016,17 @@ class ReportGenerator:
             logging.error(f"Error exporting to CSV: {e}", exc_info=True)
             return False
 
-    def generate_violation_report(self, year: int, month: int) -> Dict[str, Any]:
+    def generate_violation_report(
+        self,
+        year: int,
+        month: int,
+        emp_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
         """Generate comprehensive violation report"""
         month_key = f"{year}-{month:02d}"
         schedule = self.data_manager.get_schedule(month_key)
-        emp_stats = self.data_manager.calculate_employee_stats(month_key)
+        if emp_stats is None:
+            emp_stats = self.data_manager.calculate_employee_stats(month_key)
 
         violations = {
             "quota_violations": [],
@@ -866,72 +1078,60 @@ class ReportGenerator:
     ) -> str:
         """Create text summary for dashboard display with deviation flags and optimization metrics"""
         month_key = f"{year}-{month:02d}"
-
+        # Reuse the rendered text while the result and the data are unchanged
+        cached = self._summary_cache.get(month_key)
+        revision = self.data_manager.revision
+        if (
+            cached is not None
+            and cached[0] is schedule_result
+            and cached[1] == revision
+        ):
+            return cached[2]
+
+        emp_stats, team_stats = self._get_stats(month_key, schedule_result)
         if schedule_result and schedule_result.statistics:
-            # Use statistics from ScheduleResult
-            emp_stats = schedule_result.statistics
-            team_stats = self._calculate_team_stats_from_emp_stats(emp_stats, month_key)
             violations = self._generate_violations_from_schedule_result(schedule_result)
         else:
-            team_stats = self.data_manager.get_team_stats(month_key)
-            violations = self.generate_violation_report(year, month)
+            violations = self.generate_violation_report(year, month, emp_stats)
 
         # Get deviation flag summary
-        high_severity = len(team_stats.get("high_severity_deviations", []))
-        medium_severity = len(team_stats.get("medium_severity_deviations", []))
-        low_severity = len(team_stats.get("low_severity_deviations", []))
-
-        # Add optimization info
-        opt_info = ""
-        if schedule_result:
-            method = "CP-SAT" if "CP-SAT" in schedule_result.message else "Backtracking"
-            status = "SUCCESS" if schedule_result.success else "FAILED"
-            opt_info = f"""
-Optimization Results:
-• Method: {method}
-• Status: {status}
-• Constraint Violations: {len(schedule_result.violations)}
-• Message: {schedule_result.message}
-"""
-
-        summary = f"""
-SCHEDULE SUMMARY - {calendar.month_name[month]} {year}
-{opt_info}
-Team Overview:
-• Total Employees: {team_stats['total_employees']}
-• High Experience: {team_stats['high_experience_count']}
-• Low Experience: {team_stats['low_experience_count']}
-
-Shift Distribution:
-• Total Shifts: {team_stats['total_shifts_assigned']}
-• High Exp Shifts: {team_stats['high_exp_shifts']}
-• Low Exp Shifts: {team_stats['low_exp_shifts']}
-
-Experience Bucket Targets:
-• High Exp Target: {team_stats.get('high_exp_target', 'N/A')}
-• Low Exp Target: {team_stats.get('low_exp_target', 'N/A')}
-• High Exp Deviation: {team_stats.get('high_exp_target_deviation', 'N/A')}
-• Low Exp Deviation: {team_stats.get('low_exp_target_deviation', 'N/A')}
-
-Deviation Flags:
-• High Severity: {high_severity} (Critical quota violations)
-• Medium Severity: {medium_severity} (Moderate deviations)
-• Low Severity: {low_severity} (Minor adjustments)
-
-Issues:
-• Quota Violations: {violations['summary']['total_quota_violations']}
-• Unassigned Shifts: {violations['summary']['total_unassigned_shifts']}
-• Over Quota: {violations['summary']['employees_over_quota']}
-• Under Quota: {violations['summary']['employees_under_quota']}
-        """
+        high_flags = team_stats.get("high_severity_deviations", ())
+        high_severity, medium_severity, low_severity = _severity_counts(team_stats)
+
+        buf = io.StringIO()
+        buf.write(f"SCHEDULE SUMMARY - {calendar.month_name[month]} {year}\n\n")
+
+        opt_info = _format_opt_info(schedule_result)
+        if opt_info:
+            buf.write(opt_info)
+            buf.write("\n\n")
+
+        # Flatten the template inputs into one dict so every field resolves
+        # with a single lookup; team stats may lack bucket targets, which
+        # then show as N/A
+        context = {
+            **_SUMMARY_DEFAULTS,
+            **team_stats,
+            **violations["summary"],
+            "high_severity": high_severity,
+            "medium_severity": medium_severity,
+            "low_severity": low_severity,
+        }
+        buf.write(_SUMMARY_BODY_TEMPLATE.format_map(context))
 
-        # Add specific high-severity deviation details
+        # Add specific high-severity deviation details; a broken schedule can
+        # flag every employee, so the lines go straight into the buffer
         if high_severity > 0:
-            summary += "\n\nHIGH SEVERITY DEVIATIONS:"
-            for flag in team_stats.get("high_severity_deviations", []):
-                summary += f"\n• {flag['employee_name']}: {flag['description']}"
+            buf.write("\n\nHIGH SEVERITY DEVIATIONS:")
+            for name, description in map(_flag_name_description, high_flags):
+                buf.write("\n• ")
+                buf.write(name)
+                buf.write(": ")
+                buf.write(description)
 
-        return summary.strip()
+        summary = buf.getvalue()
+        self._summary_cache[month_key] = (schedule_result, revision, summary)
+        return summary
 
 
 class ExportManager:
@@ -940,6 +1140,13 @@ class ExportManager:
     def __init__(self, data_manager: DataManager):
         self.data_manager = data_manager
         self.report_generator = ReportGenerator(data_manager)
+        self._exporters = {
+            "pdf": self.report_generator.export_calendar_pdf,
+            "excel": self.report_generator.export_schedule_excel,
+            "csv": self.report_generator.export_schedule_csv,
+        }
+        # Exporters that take no ScheduleResult
+        self._csv_formats = {"csv"}
 
     def export_calendar(
         self,
@@ -948,46 +1155,63 @@ class ExportManager:
         format_type: str,
         output_path: str,
         schedule_result: Optional[ScheduleResult] = None,
+        context: Optional[_ExportContext] = None,
     ) -> bool:
         """Export calendar in specified format with optional ScheduleResult"""
-        if format_type.lower() == "pdf":
-            return self.report_generator.export_calendar_pdf(
-                year, month, output_path, schedule_result
-            )
-        elif format_type.lower() == "excel":
-            return self.report_generator.export_schedule_excel(
-                year, month, output_path, schedule_result
-            )
-        elif format_type.lower() == "csv":
-            return self.report_generator.export_schedule_csv(year, month, output_path)
-        else:
+        fmt = format_type.lower()
+        exporter = self._exporters.get(fmt)
+        if exporter is None:
             raise ValueError(f"Unsupported format: {format_type}")
+        if fmt in self._csv_formats:
+            return exporter(year, month, output_path, context=context)
+        return exporter(year, month, output_path, schedule_result, context=context)
 
-    def get_default_filename(self, year: int, month: int, format_type: str) -> str:
+    def get_default_filename(
+        self, year: int, month: int, format_type: str, timestamp: Optional[str] = None
+    ) -> str:
         """Generate default filename for export"""
-        month_name = calendar.month_name[month].lower()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        return f"shift_schedule_{month_name}_{year}_{timestamp}.{format_type.lower()}"
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        return (
+            f"shift_schedule_{_MONTH_NAME_LOWER[month]}_{year}_{timestamp}"
+            f".{format_type.lower()}"
+        )
 
     def batch_export(
         self, year: int, month: int, output_dir: str, formats: List[str] = None
     ) -> Dict[str, bool]:
-        """Export schedule in multiple formats"""
+        """Export schedule in multiple formats, keyed by lowercase format"""
         if formats is None:
             formats = ["pdf", "excel", "csv"]
+        else:
+            formats = [format_type.lower() for format_type in formats]
+            # Reject unknown formats before touching the filesystem
+            unknown = set(formats) - self._exporters.keys()
+            if unknown:
+                raise ValueError(f"Unsupported formats: {sorted(unknown)}")
 
         results = {}
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        output_dir = os.fspath(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+        # One timestamp per batch so all files of a run share the same suffix
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        # Schedule, employees and statistics are gathered once for all formats;
+        # if that fails, each exporter gathers (and reports) on its own
+        try:
+            context = self.report_generator._build_context(year, month)
+        except Exception as e:
+            logging.error(f"Error preparing export data: {e}", exc_info=True)
+            context = None
 
+        # The writers are CPU-bound and not thread-safe, so formats run in
+        # sequence on the shared context
         for format_type in formats:
-            filename = self.get_default_filename(year, month, format_type)
-            file_path = output_path / filename
+            filename = self.get_default_filename(year, month, format_type, timestamp)
+            file_path = os.path.join(output_dir, filename)
 
             try:
                 results[format_type] = self.export_calendar(
-                    year, month, format_type, str(file_path)
+                    year, month, format_type, file_path, context=context
                 )
             except Exception as e:
                 logging.error(f"Error exporting {format_type}: {e}", exc_info=True)
@@ -6,29 +6,49 @@ experience-based allocation and rest constraints.
 """
 
 from datetime import date, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import calendar
 import logging
+import os
 import time
 
 from ortools.sat.python import cp_model
 
 from .data_manager import DataManager
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
+# CP-SAT runs core search on its first workers and LNS on the rest
+_MIN_SEARCH_WORKERS = 8
+
+# CP-SAT parameters tuned for these small Boolean rostering models; level 1
+# linearization/probing reaches optimal faster than the defaults here
+_SOLVER_PARAMETERS = {"linearization_level": 1, "cp_model_probing_level": 1}
+
 
 class ShiftType(Enum):
     DAY = "day_shift"
     NIGHT = "night_shift"
 
 
+# Plain int shift indexes for the model-building hot path (ShiftType stays the
+# public type); the tuples below are indexed by them
+_DAY, _NIGHT = 0, 1
+_SHIFTS = (_DAY, _NIGHT)
+# Schedule key and preference/off-shift spelling of each shift
+_SHIFT_KEYS = (ShiftType.DAY.value, ShiftType.NIGHT.value)
+_SHIFT_TYPE_STRS = ("day", "night")
+_SHIFTS_BY_STR = {"day": _DAY, "night": _NIGHT}
+
+
+class ScheduleMethod(Enum):
+    CP_SAT = "CP-SAT"
+    BACKTRACKING = "Backtracking"
+
+
 @dataclass
 class Shift:
     """Represents a single shift slot"""
@@ -47,6 +67,7 @@ class ScheduleResult:
     violations: List[str]
     statistics: Dict[str, Any]
     message: str
+    method: Optional[ScheduleMethod] = None
 
 
 class ConstraintViolation:
@@ -63,14 +84,56 @@ class ConstraintViolation:
     NEXT_DAY_CONFLICT = "Cannot work on day following this night shift"
 
 
+@lru_cache(maxsize=32)
+def _month_date_strs(year: int, month: int) -> Tuple[str, ...]:
+    """ISO date strings for every day of a month, indexed by day - 1"""
+    days_in_month = calendar.monthrange(year, month)[1]
+    return tuple(
+        date(year, month, day).isoformat() for day in range(1, days_in_month + 1)
+    )
+
+
+class _ObjectiveThresholdCallback(cp_model.CpSolverSolutionCallback):
+    """Stops the search once a solution's objective is good enough"""
+
+    def __init__(self, threshold: float):
+        super().__init__()
+        self.threshold = threshold
+
+    def OnSolutionCallback(self):
+        if self.ObjectiveValue() <= self.threshold:
+            self.StopSearch()
+
+
+def _default_num_workers() -> int:
+    """CP-SAT worker count; its full search portfolio needs at least 8"""
+    return max(_MIN_SEARCH_WORKERS, os.cpu_count() or 1)
+
+
 class ShiftScheduler:
     """Main scheduler class implementing CP-SAT optimization for shift scheduling"""
 
-    def __init__(self, data_manager: DataManager):
+    def __init__(self, data_manager: DataManager, num_workers: Optional[int] = None):
         self.data_manager = data_manager
+        self.num_workers = num_workers or _default_num_workers()
+        # Extra CpSolver parameters, overridable per instance for comparisons
+        self.solver_parameters: Dict[str, Any] = dict(_SOLVER_PARAMETERS)
+        # Quota penalty at or below which a solution is accepted without
+        # waiting for an optimality proof or the time limit
+        self.acceptable_objective = 0
+        self._solver: Optional[cp_model.CpSolver] = None
+        # (year, month, data revision) the month caches were built for
+        self._initialized_for: Optional[Tuple[int, int, int]] = None
+        # (inputs key, model, variables) of the last full model built
+        self._model_cache: Optional[tuple] = None
         self.employees = {}  # Cache employees by ID
         self.quotas = {}  # Cache quotas
         self.absences = {}  # Cache absences
+        self._date_strs: Tuple[str, ...] = ()  # "YYYY-MM-DD" by day - 1
+        # Per employee: shift types allowed by preference, and (day, shift)
+        # cells of this month blocked by absences or off-shifts
+        self._allowed_shift_types: Dict[int, frozenset] = {}
+        self._blocked_cells: Dict[int, Set[Tuple[int, int]]] = {}
 
     def generate_schedule(
         self,
@@ -177,9 +240,7 @@ class ShiftScheduler:
             partial_schedule = self._extract_partial_schedule_from_solution(
                 solver, variables, year, month, existing_schedule
             )
-            schedule = self._merge_partial_schedule(
-                existing_schedule, partial_schedule, days_to_generate
-            )
+            schedule = self._merge_partial_schedule(existing_schedule, partial_schedule)
             message = f"Partial schedule generated successfully for {len(days_to_generate)} days."
             violations = self._validate_cp_sat_solution(schedule, year, month)
             if violations:
@@ -203,6 +264,7 @@ class ShiftScheduler:
             violations=violations,
             statistics=statistics,
             message=message,
+            method=ScheduleMethod.CP_SAT,
         )
 
     def _generate_full_schedule_cp_sat(
@@ -257,12 +319,26 @@ class ShiftScheduler:
             violations=violations,
             statistics=statistics,
             message=message,
+            method=ScheduleMethod.CP_SAT,
         )
 
+    def invalidate_caches(self):
+        """Force the next generation to reload employees, quotas and absences"""
+        self._initialized_for = None
+        self._model_cache = None
+
     def _initialize_for_month(self, year: int, month: int):
         """Initialize caches for the target month"""
+        # Partial generation initializes twice per run; skip the reload while
+        # the month and the data revision are unchanged
+        initialized_for = (year, month, self.data_manager.revision)
+        if self._initialized_for == initialized_for:
+            return
+        self._initialized_for = initialized_for
+
         # Cache employees
-        self.employees = {emp.id: emp for emp in self.data_manager.get_employees()}
+        self.employees = {emp.id: emp for emp in self.data_manager.iter_employees()}
+        self._date_strs = _month_date_strs(year, month)
 
         # Cache quotas for month length using bucket system
         days_in_month = calendar.monthrange(year, month)[1]
@@ -278,6 +354,32 @@ class ShiftScheduler:
         for emp_id in self.employees:
             self.absences[emp_id] = set(self.data_manager.get_absences(emp_id))
 
+        # Resolve absences, off-shifts and preferences to day indexes once, so
+        # eligibility checks are plain set lookups
+        day_of = {date_str: day for day, date_str in enumerate(self._date_strs, 1)}
+        self._allowed_shift_types = {}
+        self._blocked_cells = {}
+        for emp_id, emp in self.employees.items():
+            preferred_types = emp.preferences.preferred_shift_types
+            self._allowed_shift_types[emp_id] = frozenset(
+                shift_type
+                for shift_type, type_str in enumerate(_SHIFT_TYPE_STRS)
+                if preferred_types == ["both"] or type_str in preferred_types
+            )
+
+            blocked = set()
+            for date_str in self.absences[emp_id]:
+                day = day_of.get(date_str)
+                if day is not None:
+                    blocked.add((day, _DAY))
+                    blocked.add((day, _NIGHT))
+            for date_str, type_str in emp.preferences.off_shifts:
+                day = day_of.get(date_str)
+                shift_type = _SHIFTS_BY_STR.get(type_str)
+                if day is not None and shift_type is not None:
+                    blocked.add((day, shift_type))
+            self._blocked_cells[emp_id] = blocked
+
     def _detect_partial_generation_scope(
         self, year: int, month: int
     ) -> Tuple[bool, int, Dict[str, Dict[str, Optional[int]]], List[int]]:
@@ -307,13 +409,13 @@ class ShiftScheduler:
         existing_schedule = self.data_manager.get_schedule(month_key) or {}
         days_in_month = calendar.monthrange(year, month)[1]
 
+        date_strs = _month_date_strs(year, month)
         days_to_generate = []
 
         if is_current_month:
             # Include unfilled past days
             for day in range(1, current_day + 1):
-                date_str = date(year, month, day).strftime("%Y-%m-%d")
-                day_schedule = existing_schedule.get(date_str, {})
+                day_schedule = existing_schedule.get(date_strs[day - 1], {})
                 day_shift_info = day_schedule.get("day_shift")
                 night_shift_info = day_schedule.get("night_shift")
 
@@ -334,8 +436,7 @@ class ShiftScheduler:
                 days_to_generate.append(day)
         else:  # Past month with gaps
             for day in range(1, days_in_month + 1):
-                date_str = date(year, month, day).strftime("%Y-%m-%d")
-                day_schedule = existing_schedule.get(date_str, {})
+                day_schedule = existing_schedule.get(date_strs[day - 1], {})
                 day_shift_info = day_schedule.get("day_shift")
                 night_shift_info = day_schedule.get("night_shift")
 
@@ -379,18 +480,14 @@ class ShiftScheduler:
         Returns:
             Dict mapping employee names to adjusted quotas for remaining period
         """
-        days_in_month = calendar.monthrange(year, month)[1]
-
         # Initialize month data
         self._initialize_for_month(year, month)
 
-        # Calculate shifts already worked in the current month
+        # Calculate shifts already worked in the current month; only filled
+        # dates are stored, so walk those instead of every day of the month
         shifts_worked = {emp.name: 0 for emp in self.employees.values()}
 
-        for day in range(1, days_in_month + 1):
-            date_str = date(year, month, day).strftime("%Y-%m-%d")
-            day_schedule = existing_schedule.get(date_str, {})
-
+        for day_schedule in existing_schedule.values():
             for shift_type, emp_info in day_schedule.items():
                 if emp_info:
                     emp_id = emp_info.get("employee_id")
@@ -440,64 +537,41 @@ class ShiftScheduler:
         # Create model
         model = cp_model.CpModel()
 
-        # Decision variables: x[e][d][s] = 1 if employee e is assigned to shift s on day d
-        x = {}
-        for emp_id in self.employees:
-            x[emp_id] = {}
-            for day in days_to_generate:
-                x[emp_id][day] = {}
-                for shift_type in [ShiftType.DAY, ShiftType.NIGHT]:
-                    var_name = f"x_{emp_id}_{day}_{shift_type.value}"
-                    x[emp_id][day][shift_type] = model.NewBoolVar(var_name)
-
         # Create eligibility matrix for days_to_generate
         eligible = self._create_eligibility_matrix_partial(
             year, month, days_to_generate
         )
 
+        # Decision variables: x[e, d, s] = 1 if employee e is assigned to shift s on day d
+        x = self._create_shift_variables(model, eligible, days_to_generate)
+
         # Handle cross-date constraints for partial generation
         self._handle_cross_date_constraints_partial(
             model, x, existing_schedule, year, month, days_to_generate
         )
 
-        # Constraint 1: Eligibility (respect absences, off-days, preferences) for days_to_generate
-        for emp_id in self.employees:
-            for day in days_to_generate:
-                for shift_type in [ShiftType.DAY, ShiftType.NIGHT]:
-                    if not eligible[emp_id][day][shift_type]:
-                        model.Add(x[emp_id][day][shift_type] == 0)
-
+        # Constraint 1 (eligibility) is built into x: ineligible cells are fixed to 0
         # Constraint 2: No employee works both shifts on same day (days_to_generate)
         for emp_id in self.employees:
             for day in days_to_generate:
-                model.Add(
-                    x[emp_id][day][ShiftType.DAY] + x[emp_id][day][ShiftType.NIGHT] <= 1
-                )
+                model.AddAtMostOne([x[emp_id, day, _DAY], x[emp_id, day, _NIGHT]])
 
         # Constraint 3: Each shift is assigned to exactly one employee (days_to_generate)
         for day in days_to_generate:
-            for shift_type in [ShiftType.DAY, ShiftType.NIGHT]:
-                shift_vars = [
-                    x[emp_id][day][shift_type]
-                    for emp_id in self.employees
-                    if day in x[emp_id]
-                ]
+            for shift_type in _SHIFTS:
+                shift_vars = [x[emp_id, day, shift_type] for emp_id in self.employees]
                 # Only enforce if the day needs generation
-                date_str = date(year, month, day).strftime("%Y-%m-%d")
-                shift_key = (
-                    "day_shift" if shift_type == ShiftType.DAY else "night_shift"
-                )
+                date_str = self._date_strs[day - 1]
+                shift_key = _SHIFT_KEYS[shift_type]
                 if existing_schedule.get(date_str, {}).get(shift_key) is None:
-                    model.Add(sum(shift_vars) == 1)
+                    model.AddExactlyOne(shift_vars)
 
         # Constraint 4: Quota constraints for remaining period (soft constraint)
         quota_penalty_terms = []
         for emp_id, emp in self.employees.items():
             adjusted_quota = adjusted_quotas.get(emp.name, 0)
-            total_shifts_in_gen_days = sum(
-                x[emp_id][day][ShiftType.DAY] + 2 * x[emp_id][day][ShiftType.NIGHT]
-                for day in days_to_generate
-                if day in x[emp_id]
+            total_shifts_in_gen_days = self._weighted_shift_total(
+                x, emp_id, days_to_generate
             )
             # Soft constraint for quota
             model.Add(
@@ -511,7 +585,7 @@ class ShiftScheduler:
 
         # Minimize total penalty
         if quota_penalty_terms:
-            model.Minimize(sum(quota_penalty_terms))
+            model.Minimize(cp_model.LinearExpr.Sum(quota_penalty_terms))
 
         # Store variables for later use
         variables = {
@@ -523,10 +597,41 @@ class ShiftScheduler:
 
         return model, variables
 
+    def _create_shift_variables(
+        self,
+        model: Any,
+        eligible: Set[Tuple[int, int, int]],
+        days: Iterable[int],
+    ) -> Dict[Tuple[int, int, int], Any]:
+        """Create x[e, d, s] with a BoolVar per eligible cell and a shared 0 otherwise"""
+        # Ineligible cells never become solver variables (no extra == 0 rows)
+        zero = model.NewConstant(0)
+        x = {}
+        for emp_id in self.employees:
+            for day in days:
+                for shift_type in _SHIFTS:
+                    if (emp_id, day, shift_type) in eligible:
+                        var_name = f"x_{emp_id}_{day}_{_SHIFT_KEYS[shift_type]}"
+                        x[emp_id, day, shift_type] = model.NewBoolVar(var_name)
+                    else:
+                        x[emp_id, day, shift_type] = zero
+        return x
+
+    @staticmethod
+    def _weighted_shift_total(
+        x: Dict[Tuple[int, int, int], Any], emp_id: int, days: Iterable[int]
+    ) -> Any:
+        """Shift units worked by one employee over days (a night counts as two)"""
+        day_vars = [x[emp_id, day, _DAY] for day in days]
+        night_vars = [x[emp_id, day, _NIGHT] for day in days]
+        return cp_model.LinearExpr.WeightedSum(
+            day_vars + night_vars, [1] * len(day_vars) + [2] * len(night_vars)
+        )
+
     def _handle_cross_date_constraints_partial(
         self,
         model: Any,
-        x: Dict[int, Dict[int, Dict[ShiftType, Any]]],
+        x: Dict[Tuple[int, int, int], Any],
         existing_schedule: Dict[str, Dict[str, Optional[int]]],
         year: int,
         month: int,
@@ -544,14 +649,15 @@ class ShiftScheduler:
                     prev_day = day - 1
                     if prev_day in days_to_generate:
                         # Constraint is between two generated days
-                        model.Add(
-                            x[emp_id][day][ShiftType.DAY]
-                            + x[emp_id][prev_day][ShiftType.NIGHT]
-                            <= 1
+                        model.AddAtMostOne(
+                            [
+                                x[emp_id, day, _DAY],
+                                x[emp_id, prev_day, _NIGHT],
+                            ]
                         )
                     else:
                         # Constraint is between a generated day and an existing day
-                        prev_date_str = date(year, month, prev_day).strftime("%Y-%m-%d")
+                        prev_date_str = self._date_strs[prev_day - 1]
                         prev_night_emp = existing_schedule.get(prev_date_str, {}).get(
                             "night_shift"
                         )
@@ -559,19 +665,20 @@ class ShiftScheduler:
                             prev_night_emp
                             and prev_night_emp.get("employee_id") == emp_id
                         ):
-                            model.Add(x[emp_id][day][ShiftType.DAY] == 0)
+                            model.Add(x[emp_id, day, _DAY] == 0)
 
                 # No consecutive night shifts
                 if day < days_in_month:
                     next_day = day + 1
                     if next_day in days_to_generate:
-                        model.Add(
-                            x[emp_id][day][ShiftType.NIGHT]
-                            + x[emp_id][next_day][ShiftType.NIGHT]
-                            <= 1
+                        model.AddAtMostOne(
+                            [
+                                x[emp_id, day, _NIGHT],
+                                x[emp_id, next_day, _NIGHT],
+                            ]
                         )
                     else:
-                        next_date_str = date(year, month, next_day).strftime("%Y-%m-%d")
+                        next_date_str = self._date_strs[next_day - 1]
                         next_night_emp = existing_schedule.get(next_date_str, {}).get(
                             "night_shift"
                         )
@@ -579,28 +686,19 @@ class ShiftScheduler:
                             next_night_emp
                             and next_night_emp.get("employee_id") == emp_id
                         ):
-                            model.Add(x[emp_id][day][ShiftType.NIGHT] == 0)
+                            model.Add(x[emp_id, day, _NIGHT] == 0)
 
     def _create_eligibility_matrix_partial(
-        self, year: int, month: int, days_to_generate: List[int]
-    ) -> Dict[int, Dict[int, Dict[ShiftType, bool]]]:
-        """Create eligibility matrix for days_to_generate in partial generation"""
-        eligible = {}
-
-        for emp_id, emp in self.employees.items():
-            eligible[emp_id] = {}
-            for day in days_to_generate:
-                eligible[emp_id][day] = {}
-                shift_date = date(year, month, day)
-
-                for shift_type in [ShiftType.DAY, ShiftType.NIGHT]:
-                    eligible[emp_id][day][shift_type] = (
-                        self._is_employee_eligible_for_shift(
-                            emp_id, shift_date, shift_type
-                        )
-                    )
-
-        return eligible
+        self, year: int, month: int, days_to_generate: Iterable[int]
+    ) -> Set[Tuple[int, int, int]]:
+        """Create the set of eligible (employee, day, shift) cells for days_to_generate"""
+        return {
+            (emp_id, day, shift_type)
+            for emp_id in self.employees
+            for day in days_to_generate
+            for shift_type in _SHIFTS
+            if self._is_employee_eligible_for_shift(emp_id, day, shift_type)
+        }
 
     def _extract_partial_schedule_from_solution(
         self,
@@ -613,56 +711,60 @@ class ShiftScheduler:
         """Extract partial schedule from CP-SAT solution for days_to_generate"""
         x = variables["x"]
         days_to_generate = variables["days_to_generate"]
+        assigned = self._assigned_cells(solver, x)
         partial_schedule = {}
 
         for day in days_to_generate:
-            date_str = date(year, month, day).strftime("%Y-%m-%d")
+            date_str = self._date_strs[day - 1]
             partial_schedule[date_str] = {}
 
             # Find who was assigned
             day_emp, night_emp = None, None
-            for emp_id in self.employees:
-                if day in x[emp_id]:
-                    if solver.Value(x[emp_id][day][ShiftType.DAY]) == 1:
-                        day_emp = {"employee_id": emp_id, "is_manual": False}
-                    if solver.Value(x[emp_id][day][ShiftType.NIGHT]) == 1:
-                        night_emp = {"employee_id": emp_id, "is_manual": False}
+            if (day, _DAY) in assigned:
+                day_emp = {
+                    "employee_id": assigned[day, _DAY],
+                    "is_manual": False,
+                }
+            if (day, _NIGHT) in assigned:
+                night_emp = {
+                    "employee_id": assigned[day, _NIGHT],
+                    "is_manual": False,
+                }
 
             partial_schedule[date_str]["day_shift"] = day_emp
             partial_schedule[date_str]["night_shift"] = night_emp
 
         return partial_schedule
 
+    @staticmethod
+    def _assigned_cells(
+        solver: Any, x: Dict[Tuple[int, int, int], Any]
+    ) -> Dict[Tuple[int, int], int]:
+        """Map (day, shift) -> assigned employee ID from the solver's response"""
+        # One copy of the solution vector instead of a solver.Value call per cell
+        values = list(solver.response_proto.solution)
+        return {
+            (day, shift_type): emp_id
+            for (emp_id, day, shift_type), var in x.items()
+            if values[var.Index()]
+        }
+
     def _merge_partial_schedule(
         self,
         existing_schedule: Dict,
         partial_schedule: Dict,
-        days_to_generate: List[int],
     ) -> Dict:
         """Merge existing schedule with newly generated partial schedule, only filling gaps."""
         merged = existing_schedule.copy()
 
-        for day in days_to_generate:
-            date_str = date(
-                int(list(partial_schedule.keys())[0][:4]),
-                int(list(partial_schedule.keys())[0][5:7]),
-                day,
-            ).strftime("%Y-%m-%d")
-
-            if date_str not in merged:
-                merged[date_str] = {}
+        # partial_schedule is keyed by exactly the generated dates
+        for date_str, shifts in partial_schedule.items():
+            merged_day = merged.setdefault(date_str, {})
 
             # Only update if the existing shift was None
-            if merged[date_str].get("day_shift") is None and partial_schedule.get(
-                date_str, {}
-            ).get("day_shift"):
-                merged[date_str]["day_shift"] = partial_schedule[date_str]["day_shift"]
-            if merged[date_str].get("night_shift") is None and partial_schedule.get(
-                date_str, {}
-            ).get("night_shift"):
-                merged[date_str]["night_shift"] = partial_schedule[date_str][
-                    "night_shift"
-                ]
+            for shift_key in ("day_shift", "night_shift"):
+                if merged_day.get(shift_key) is None and shifts.get(shift_key):
+                    merged_day[shift_key] = shifts[shift_key]
 
         return merged
 
@@ -682,6 +784,16 @@ class ShiftScheduler:
         # Initialize data for the month
         self._initialize_for_month(year, month)
 
+        # Re-solves with unchanged inputs reuse the built model; only the
+        # warm-start hints depend on the (since saved) prior schedule
+        cache_key = self._model_cache_key(year, month, allow_quota_violations)
+        if self._model_cache is not None and self._model_cache[0] == cache_key:
+            _, model, variables = self._model_cache
+            model.ClearHints()
+            if warm_start:
+                self._set_warm_start_hints(model, variables["x"], year, month)
+            return model, variables
+
         # Get month information
         days_in_month = calendar.monthrange(year, month)[1]
         num_employees = len(self.employees)
@@ -689,90 +801,86 @@ class ShiftScheduler:
         # Create model
         model = cp_model.CpModel()
 
-        # Decision variables: x[e][d][s] = 1 if employee e is assigned to shift s on day d
-        x = {}
-        for emp_id in self.employees:
-            x[emp_id] = {}
-            for day in range(1, days_in_month + 1):
-                x[emp_id][day] = {}
-                for shift_type in [ShiftType.DAY, ShiftType.NIGHT]:
-                    var_name = f"x_{emp_id}_{day}_{shift_type.value}"
-                    x[emp_id][day][shift_type] = model.NewBoolVar(var_name)
-
         # Preprocessing: Create eligibility matrix
         eligible = self._create_eligibility_matrix(year, month)
 
-        # Constraint 1: Eligibility (respect absences, off-days, preferences)
-        for emp_id in self.employees:
-            for day in range(1, days_in_month + 1):
-                for shift_type in [ShiftType.DAY, ShiftType.NIGHT]:
-                    if not eligible[emp_id][day][shift_type]:
-                        model.Add(x[emp_id][day][shift_type] == 0)
+        # Decision variables: x[e, d, s] = 1 if employee e is assigned to shift s on day d
+        # Constraint 1 (eligibility) is built in: ineligible cells are fixed to 0
+        x = self._create_shift_variables(model, eligible, range(1, days_in_month + 1))
 
-        # Constraint 2: No employee works both shifts on same day
+        # Constraints 2-4: No employee works both shifts on same day, no day
+        # shift after a night shift (rest rule), no consecutive night shifts.
+        # The three pairs among (day d, night d, night d-1) form one clique,
+        # so each day needs a single at-most-one over those literals
         for emp_id in self.employees:
+            prev_night = None
             for day in range(1, days_in_month + 1):
-                model.Add(
-                    x[emp_id][day][ShiftType.DAY] + x[emp_id][day][ShiftType.NIGHT] <= 1
-                )
-
-        # Constraint 3: No day shift after night shift (rest rule)
-        for emp_id in self.employees:
-            for day in range(2, days_in_month + 1):  # Start from day 2
-                model.Add(
-                    x[emp_id][day][ShiftType.DAY] + x[emp_id][day - 1][ShiftType.NIGHT]
-                    <= 1
-                )
-
-        # Constraint 4: No consecutive night shifts
-        for emp_id in self.employees:
-            for day in range(2, days_in_month + 1):
-                model.Add(
-                    x[emp_id][day][ShiftType.NIGHT]
-                    + x[emp_id][day - 1][ShiftType.NIGHT]
-                    <= 1
-                )
+                shift_vars = [
+                    x[emp_id, day, _DAY],
+                    x[emp_id, day, _NIGHT],
+                ]
+                if prev_night is not None:
+                    shift_vars.append(prev_night)
+                model.AddAtMostOne(shift_vars)
+                prev_night = shift_vars[1]
 
         # Constraint 5: Each shift is assigned to exactly one employee
         for day in range(1, days_in_month + 1):
-            for shift_type in [ShiftType.DAY, ShiftType.NIGHT]:
-                shift_vars = [x[emp_id][day][shift_type] for emp_id in self.employees]
-                model.Add(sum(shift_vars) == 1)
+            for shift_type in _SHIFTS:
+                shift_vars = [x[emp_id, day, shift_type] for emp_id in self.employees]
+                model.AddExactlyOne(shift_vars)
 
         # Constraint 6: Quota constraints (as soft constraints)
-        total_shifts_per_employee = {}
-        for emp_id in self.employees:
-            shifts = []
-            for day in range(1, days_in_month + 1):
-                shifts.append(x[emp_id][day][ShiftType.DAY])
-                shifts.append(2 * x[emp_id][day][ShiftType.NIGHT])
-            total_shifts_per_employee[emp_id] = sum(shifts)
+        total_shifts_per_employee = {
+            emp_id: self._weighted_shift_total(x, emp_id, range(1, days_in_month + 1))
+            for emp_id in self.employees
+        }
 
         quota_penalty_terms = []
         for emp_id, emp in self.employees.items():
             quota = self.quotas.get(emp.name, 0)
-            deviation = model.NewIntVar(
-                -days_in_month * 2, days_in_month * 2, f"dev_{emp_id}"
-            )
-            model.Add(total_shifts_per_employee[emp_id] - quota == deviation)
-
-            # Penalize deviation from quota
-            penalty = model.NewIntVar(0, days_in_month * 2, f"pen_{emp_id}")
-            model.AddAbsEquality(penalty, deviation)
-            quota_penalty_terms.append(penalty)
+            # Penalize deviation from quota: |total - quota| = over + under at
+            # the optimum, without the channeling AddAbsEquality adds
+            over = model.NewIntVar(0, days_in_month * 2, f"over_{emp_id}")
+            under = model.NewIntVar(0, days_in_month * 2, f"under_{emp_id}")
+            model.Add(total_shifts_per_employee[emp_id] - quota == over - under)
+            quota_penalty_terms.extend([over, under])
 
         # Set objective to minimize total penalty
         if quota_penalty_terms:
-            model.Minimize(sum(quota_penalty_terms))
+            model.Minimize(cp_model.LinearExpr.Sum(quota_penalty_terms))
 
         # Store variables for later use
         variables = {"x": x, "num_days": days_in_month, "num_employees": num_employees}
+        self._model_cache = (cache_key, model, variables)
+
+        if warm_start:
+            self._set_warm_start_hints(model, x, year, month)
         return model, variables
 
+    def _model_cache_key(
+        self, year: int, month: int, allow_quota_violations: bool
+    ) -> tuple:
+        """Everything the full model is built from, after _initialize_for_month"""
+        return (
+            year,
+            month,
+            allow_quota_violations,
+            tuple(
+                (
+                    emp_id,
+                    self.quotas.get(emp.name, 0),
+                    self._allowed_shift_types[emp_id],
+                    frozenset(self._blocked_cells[emp_id]),
+                )
+                for emp_id, emp in self.employees.items()
+            ),
+        )
+
     def _set_warm_start_hints(
         self,
         model: Any,
-        x: Dict[int, Dict[int, Dict[ShiftType, Any]]],
+        x: Dict[Tuple[int, int, int], Any],
         year: int,
         month: int,
     ):
@@ -788,14 +896,11 @@ class ShiftScheduler:
 
         # Set hints for each shift based on prior assignments
         for day in range(1, calendar.monthrange(year, month)[1] + 1):
-            shift_date = date(year, month, day)
-            date_str = shift_date.strftime("%Y-%m-%d")
+            date_str = self._date_strs[day - 1]
             prior_day_schedule = prior_schedule.get(date_str, {})
 
-            for shift_type in [ShiftType.DAY, ShiftType.NIGHT]:
-                shift_key = (
-                    "day_shift" if shift_type == ShiftType.DAY else "night_shift"
-                )
+            for shift_type in _SHIFTS:
+                shift_key = _SHIFT_KEYS[shift_type]
                 prior_shift_info = prior_day_schedule.get(shift_key)
 
                 if prior_shift_info is not None:
@@ -805,73 +910,61 @@ class ShiftScheduler:
                     else:
                         prior_emp_id = prior_shift_info
 
-                    if prior_emp_id is not None and prior_emp_id in self.employees:
+                    # Only the positive assignment is hinted: AddExactlyOne already
+                    # implies the zeros, and ineligible cells are fixed constants
+                    if (
+                        prior_emp_id is not None
+                        and prior_emp_id in self.employees
+                        and self._is_employee_eligible_for_shift(
+                            prior_emp_id, day, shift_type
+                        )
+                    ):
                         # Set hint: this employee was assigned this shift
-                        model.AddHint(x[prior_emp_id][day][shift_type], 1)
+                        model.AddHint(x[prior_emp_id, day, shift_type], 1)
                         logger.debug(
-                            f"Hint: {self.employees[prior_emp_id].name} assigned to {shift_type.value} on {date_str}"
+                            f"Hint: {self.employees[prior_emp_id].name} assigned to {_SHIFT_KEYS[shift_type]} on {date_str}"
                         )
 
-                        # Set hints for other employees: they were NOT assigned this shift
-                        for other_emp_id in self.employees:
-                            if other_emp_id != prior_emp_id:
-                                model.AddHint(x[other_emp_id][day][shift_type], 0)
-
     def _create_eligibility_matrix(
         self, year: int, month: int
-    ) -> Dict[int, Dict[int, Dict[ShiftType, bool]]]:
-        """Create matrix of employee eligibility for each shift"""
-        days_in_month = calendar.monthrange(year, month)[1]
-        eligible = {}
-
-        for emp_id, emp in self.employees.items():
-            eligible[emp_id] = {}
-            for day in range(1, days_in_month + 1):
-                eligible[emp_id][day] = {}
-                shift_date = date(year, month, day)
-                date_str = shift_date.strftime("%Y-%m-%d")
-
-                for shift_type in [ShiftType.DAY, ShiftType.NIGHT]:
-                    # Check basic eligibility
-                    is_eligible = self._is_employee_eligible_for_shift(
-                        emp_id, shift_date, shift_type
-                    )
-                    eligible[emp_id][day][shift_type] = is_eligible
-
-        return eligible
+    ) -> Set[Tuple[int, int, int]]:
+        """Create the set of eligible (employee, day, shift) cells for the month"""
+        return self._create_eligibility_matrix_partial(
+            year, month, range(1, len(self._date_strs) + 1)
+        )
 
     def _is_employee_eligible_for_shift(
-        self, emp_id: int, shift_date: date, shift_type: ShiftType
+        self, emp_id: int, day: int, shift_type: int
     ) -> bool:
-        """Check if employee is eligible for specific shift on specific date"""
-        emp = self.employees[emp_id]
-        date_str = shift_date.strftime("%Y-%m-%d")
-
-        # Check absence
-        if date_str in self.absences.get(emp_id, set()):
-            return False
-
-        # Check off-shifts
-        shift_type_str = "day" if shift_type == ShiftType.DAY else "night"
-        if (date_str, shift_type_str) in emp.preferences.off_shifts:
-            return False
-
-        # Check preferred shift types
-        preferred_types = emp.preferences.preferred_shift_types
-        if preferred_types != ["both"] and shift_type_str not in preferred_types:
-            return False
-
-        return True
+        """Check if employee is eligible for a shift on a day of the initialized month"""
+        # Absences, off-shifts and preferences are resolved in _initialize_for_month
+        return (
+            shift_type in self._allowed_shift_types[emp_id]
+            and (day, shift_type) not in self._blocked_cells[emp_id]
+        )
 
     def _solve_cp_sat_model(
         self, model: Any, variables: Dict, time_limit_seconds: float = 30.0
     ) -> Optional[Any]:
         """Solve the CP-SAT model with time limit"""
-        solver = cp_model.CpSolver()
+        # One solver per scheduler; parameters are reapplied on every solve
+        if self._solver is None:
+            self._solver = cp_model.CpSolver()
+        solver = self._solver
         solver.parameters.max_time_in_seconds = time_limit_seconds
-
-        # Solve the model
-        status = solver.Solve(model)
+        solver.parameters.num_workers = self.num_workers
+        for name, value in self.solver_parameters.items():
+            setattr(solver.parameters, name, value)
+        # Route the solver's progress log through our logger, not stdout
+        solver.parameters.log_search_progress = logger.isEnabledFor(logging.DEBUG)
+        if solver.parameters.log_search_progress:
+            solver.parameters.log_to_stdout = False
+            solver.log_callback = logger.debug
+
+        # Solve the model, stopping early on a good enough solution
+        status = solver.Solve(
+            model, _ObjectiveThresholdCallback(self.acceptable_objective)
+        )
 
         if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
             return solver
@@ -885,21 +978,16 @@ class ShiftScheduler:
         self, solver: Any, variables: Dict, year: int, month: int
     ) -> Dict[str, Dict[str, Optional[int]]]:
         """Extract schedule from CP-SAT solution"""
-        x = variables["x"]
+        assigned = self._assigned_cells(solver, variables["x"])
         schedule = {}
 
         for day in range(1, variables["num_days"] + 1):
-            shift_date = date(year, month, day)
-            date_str = shift_date.strftime("%Y-%m-%d")
+            date_str = self._date_strs[day - 1]
             schedule[date_str] = {"day_shift": None, "night_shift": None}
-            for emp_id in self.employees:
-                if solver.Value(x[emp_id][day][ShiftType.DAY]) == 1:
-                    schedule[date_str]["day_shift"] = {
-                        "employee_id": emp_id,
-                        "is_manual": False,
-                    }
-                if solver.Value(x[emp_id][day][ShiftType.NIGHT]) == 1:
-                    schedule[date_str]["night_shift"] = {
+            for shift_type in _SHIFTS:
+                emp_id = assigned.get((day, shift_type))
+                if emp_id is not None:
+                    schedule[date_str][_SHIFT_KEYS[shift_type]] = {
                         "employee_id": emp_id,
                         "is_manual": False,
                     }
@@ -1064,7 +1152,7 @@ class ShiftScheduler:
         }
 
         # Initialize employee stats
-        for emp in self.data_manager.get_employees():
+        for emp in self.data_manager.iter_employees():
             stats["employee_stats"][emp.name] = {
                 "day_shifts": 0,
                 "night_shifts": 0,
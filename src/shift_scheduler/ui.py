@@ -15,7 +15,6 @@ import logging
 
 from .data_manager import DataManager, Employee, EmployeePreferences
 from .scheduler_logic import ShiftScheduler, ScheduleResult
-from .reporting import ExportManager
 
 logger = logging.getLogger(__name__)
 
@@ -264,11 +263,11 @@ class CalendarCell(ctk.CTkFrame):
 
         # Employee list for dropdowns
         self.employee_names = [
-            emp.name for emp in self.data_manager.get_employees(active_only=True)
+            emp.name for emp in self.data_manager.iter_employees(active_only=True)
         ]
         self.employee_map = {
             emp.name: emp.id
-            for emp in self.data_manager.get_employees(active_only=True)
+            for emp in self.data_manager.iter_employees(active_only=True)
         }
         self.options = ["Unassigned"] + self.employee_names
 
@@ -445,7 +444,7 @@ class CalendarView(ctk.CTkScrollableFrame):
             self.data_manager.set_shift_assignment(
                 month_key, date_str, shift_type, None, is_manual=True
             )
-            self.data_manager.save_data()
+            self.main_window.schedule_save()
             self.update_schedule_display()
             self.main_window.dashboard.update_dashboard(month_key)
             return
@@ -473,8 +472,8 @@ class CalendarView(ctk.CTkScrollableFrame):
             month_key, date_str, shift_type, emp_id, is_manual=True
         )
 
-        # Save data and refresh the entire UI
-        self.data_manager.save_data()
+        # Save data (coalesced with other quick edits) and refresh the entire UI
+        self.main_window.schedule_save()
         self.update_schedule_display()
         self.main_window.dashboard.update_dashboard(month_key)
 
@@ -735,7 +734,12 @@ class PreferencesGrid(ctk.CTkFrame):
         super().__init__(parent)
         self.employee = employee
         self.on_preferences_changed = on_preferences_changed
-        self.preferences = employee.preferences if employee else EmployeePreferences()
+        # Edit a copy: employees returned by DataManager are shared cached objects
+        self.preferences = (
+            EmployeePreferences.from_dict(employee.preferences.to_dict())
+            if employee
+            else EmployeePreferences()
+        )
 
         self._create_widgets()
         self._populate_fields()
@@ -819,7 +823,7 @@ class PreferencesGrid(ctk.CTkFrame):
     def _populate_fields(self):
         # Off shifts
         off_shift_texts = []
-        for date_str, shift_type in self.preferences.off_shifts:
+        for date_str, shift_type in sorted(self.preferences.off_shifts):
             off_shift_texts.append(f"{date_str} ({shift_type})")
         self.off_days_text.delete("1.0", "end")
         self.off_days_text.insert("1.0", "\n".join(off_shift_texts))
@@ -831,7 +835,7 @@ class PreferencesGrid(ctk.CTkFrame):
 
         # Custom quotas
         for days, entry in self.quota_entries.items():
-            quota = self.preferences.custom_quotas.get(str(days), "")
+            quota = self.preferences.custom_quotas.get(days, "")
             entry.delete(0, "end")
             entry.insert(0, str(quota) if quota else "")
 
@@ -840,7 +844,7 @@ class PreferencesGrid(ctk.CTkFrame):
         self.notes_text.insert("1.0", self.preferences.availability_notes)
 
     def _on_off_days_changed(self, shifts: List[Tuple[str, str]]):
-        self.preferences.off_shifts = shifts
+        self.preferences.off_shifts = set(shifts)
         off_shift_texts = []
         for date_str, shift_type in shifts:
             off_shift_texts.append(f"{date_str} ({shift_type})")
@@ -860,7 +864,7 @@ class PreferencesGrid(ctk.CTkFrame):
         for days, entry in self.quota_entries.items():
             value = entry.get().strip()
             if value and value.isdigit():
-                custom_quotas[str(days)] = int(value)
+                custom_quotas[days] = int(value)
 
         self.preferences.custom_quotas = custom_quotas
         self.preferences.availability_notes = self.notes_text.get("1.0", "end").strip()
@@ -1478,7 +1482,7 @@ class DashboardPanel(ctk.CTkFrame):
 
         # Get statistics
         emp_stats = self.data_manager.calculate_employee_stats(month_key)
-        team_stats = self.data_manager.get_team_stats(month_key)
+        team_stats = self.data_manager.get_team_stats(month_key, emp_stats)
 
         # Filter by experience if needed
         filter_exp = self.experience_filter.get()
@@ -1553,10 +1557,27 @@ class MainWindow(ctk.CTk):
 
         self.current_year = datetime.now().year
         self.current_month = datetime.now().month
+        self._pending_save = None  # after() id of a debounced save
+        self.export_manager = None  # Created on first export
 
         self._create_widgets()
         self._load_initial_data()
 
+    def schedule_save(self, delay_ms: int = 500):
+        """Save data after a short idle delay, coalescing rapid manual edits"""
+        if self._pending_save is not None:
+            self.after_cancel(self._pending_save)
+        self._pending_save = self.after(delay_ms, self._flush_pending_save)
+
+    def _flush_pending_save(self):
+        """Write a debounced save (pending edits are also saved on exit)"""
+        self._pending_save = None
+        try:
+            self.data_manager.save_data()
+        except Exception as e:
+            logger.error(f"Failed to save manual schedule changes: {e}")
+            self.status_var.set("Failed to save schedule changes")
+
     def _create_widgets(self):
         # Top control panel
         control_frame = ctk.CTkFrame(self, height=80)
@@ -1906,10 +1927,18 @@ class MainWindow(ctk.CTk):
         """Open employee management window"""
         EmployeeManagementWindow(self, self.data_manager)
 
+    def _get_export_manager(self):
+        """Get the export manager, importing pandas/reportlab on first use"""
+        if self.export_manager is None:
+            from .reporting import ExportManager
+
+            self.export_manager = ExportManager(self.data_manager)
+        return self.export_manager
+
     def _export_schedule(self):
         """Export current schedule to PDF, Excel, or CSV."""
         try:
-            export_manager = ExportManager(self.data_manager)
+            export_manager = self._get_export_manager()
 
             month_name = calendar.month_name[self.current_month].lower()
             initial_filename = f"shift_schedule_{month_name}_{self.current_year}"
@@ -8,7 +8,11 @@ import json
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from shift_scheduler.data_manager import DataManager
+from shift_scheduler.data_manager import (
+    DataManager,
+    DataSaveError,
+    EmployeePreferences,
+)
 
 
 @pytest.fixture
@@ -127,3 +131,199 @@ def test_data_migration_offdays_to_offshifts(tmp_path):
     # The single "offDay" should have been converted to two "off_shifts"
     expected_off_shifts = {("2025-01-10", "day"), ("2025-01-10", "night")}
     assert set(prefs.off_shifts) == expected_off_shifts
+
+
+def test_employee_cache_reflects_updates(data_manager):
+    """
+    Why this is important: Employee objects are cached between lookups. Every
+    mutation must invalidate that cache, otherwise the scheduler and UI would
+    keep working with stale names, experience levels or active flags.
+    """
+    alice = data_manager.get_employee_by_name("Alice")
+    assert data_manager.get_employee_by_id(alice.id) is alice
+
+    data_manager.update_employee(alice.id, name="Alicia", is_active=False)
+    updated = data_manager.get_employee_by_id(alice.id)
+    assert updated.name == "Alicia" and not updated.is_active
+    assert data_manager.get_employee_by_name("Alice") is None
+    assert all(e.id != alice.id for e in data_manager.get_employees())
+
+    carol = data_manager.add_employee("Carol", "High")
+    assert data_manager.get_employee_by_id(carol.id).name == "Carol"
+
+    data_manager.delete_employee(carol.id)
+    assert data_manager.get_employee_by_id(carol.id) is None
+
+
+def test_off_shift_lookup_reflects_preference_updates(data_manager):
+    """
+    Why this is important: The scheduler checks off-shifts and preferred shift
+    types for every cell through a prebuilt index, so a preference update must
+    be visible immediately.
+    """
+    alice = data_manager.get_employee_by_name("Alice")
+    assert not data_manager.is_employee_off_shift(alice.id, "2025-01-05", "day")
+
+    prefs = EmployeePreferences(
+        off_shifts={("2025-01-05", "day"), ("2025-01-05", "night")},
+        preferred_shift_types=["night"],
+    )
+    data_manager.update_employee_preferences(alice.id, prefs)
+
+    assert data_manager.is_employee_off_shift(alice.id, "2025-01-05", "day")
+    assert data_manager.is_employee_off_day(alice.id, "2025-01-05")
+    assert data_manager.get_employee_preferred_shift_types(alice.id) == ["night"]
+    assert not data_manager.is_employee_off_shift(9999, "2025-01-05", "day")
+    assert data_manager.get_employee_preferred_shift_types(9999) == ["both"]
+
+
+def test_bucket_cache_reflects_bucket_changes(data_manager):
+    """
+    Why this is important: ExperienceBucket objects are cached, so changing a
+    bucket's target or distribution method must not leave stale buckets
+    behind for the quota redistribution logic.
+    """
+    bucket = data_manager.get_experience_bucket("High")
+    assert data_manager.get_experience_bucket("High") is bucket
+
+    data_manager.set_bucket_distribution_method("High", "weighted", {"Alice": 2.0})
+    updated = data_manager.get_experience_bucket("High")
+    assert updated.distribution_method == "weighted"
+    assert updated.weight_factors == {"Alice": 2.0}
+
+    data_manager.set_experience_bucket_target("Medium", 31, 10)
+    assert data_manager.get_experience_buckets()["Medium"].target_shifts == {"31": 10}
+
+
+def test_bucket_distribution_methods(data_manager):
+    """
+    Why this is important: Bucket distributions are cached by their inputs,
+    so changing the method or weights must change the result, and the
+    proportional method must fall back to an equal split.
+    """
+    employees = data_manager.get_employees()
+
+    def distribute():
+        bucket = data_manager.get_experience_bucket("High")
+        return data_manager._calculate_bucket_distribution(bucket, employees, 31, 9)
+
+    assert distribute() == {"Alice": 5, "Bob": 4}
+
+    data_manager.set_bucket_distribution_method("High", "weighted", {"Bob": 2.0})
+    assert distribute() == {"Alice": 3, "Bob": 6}
+
+    data_manager.set_bucket_distribution_method("High", "proportional")
+    assert distribute() == {"Alice": 5, "Bob": 4}
+
+
+def test_batch_defers_saves_until_exit(data_manager, monkeypatch):
+    """
+    Why this is important: Bulk edits should not rewrite the whole data file
+    once per mutation. Saves requested inside a batch must be coalesced into a
+    single write when the outermost batch exits.
+    """
+    writes = []
+    original_save_now = data_manager._save_now
+    monkeypatch.setattr(
+        data_manager, "_save_now", lambda: writes.append(1) or original_save_now()
+    )
+
+    with data_manager.batch():
+        data_manager.add_employee("Carol", "High")
+        data_manager.save_data()
+        with data_manager.batch():
+            data_manager.add_employee("Dave", "Low")
+            data_manager.save_data()
+        assert writes == []
+
+    assert writes == [1]
+    reloaded_dm = DataManager(data_manager.data_file)
+    assert reloaded_dm.get_employee_by_name("Dave") is not None
+
+
+def test_save_rejects_data_missing_sections(data_manager):
+    """
+    Why this is important: save_data no longer re-reads the file after
+    writing, so structurally broken in-memory data must be rejected before
+    the existing file is touched.
+    """
+    data_manager.save_data()
+    saved_bytes = Path(data_manager.data_file).read_bytes()
+
+    del data_manager.data["schedules"]
+    with pytest.raises(DataSaveError):
+        data_manager.save_data()
+
+    assert Path(data_manager.data_file).read_bytes() == saved_bytes
+
+
+def test_backup_taken_once_per_session(tmp_path):
+    """
+    Why this is important: The .bak file is the recovery point if the main
+    file gets corrupted. It must hold the state the session started from,
+    while the main file always holds the latest save.
+    """
+    data_file = tmp_path / "data.json"
+    DataManager(str(data_file)).save_data()
+    original = data_file.read_bytes()
+
+    dm = DataManager(str(data_file))
+    dm.add_employee("Carol", "High")
+    dm.save_data()
+    dm.add_employee("Dave", "Low")
+    dm.save_data()
+
+    assert data_file.with_suffix(".bak").read_bytes() == original
+    assert DataManager(str(data_file)).get_employee_by_name("Dave") is not None
+
+
+def test_unchanged_saves_skip_rewrite(data_manager, monkeypatch):
+    """
+    Why this is important: Repaints and repeated saves of an unchanged
+    schedule should not rewrite the data file or refresh statistics
+    timestamps.
+    """
+    alice = data_manager.get_employee_by_name("Alice")
+    schedule = {"2025-01-01": {"day_shift": alice.id, "night_shift": None}}
+    data_manager.save_schedule_with_statistics("2025-01", schedule)
+    generated_at = data_manager.data["statistics"]["2025-01"]["generated_at"]
+
+    replaced = []
+    original_replace = os.replace
+    monkeypatch.setattr(
+        os, "replace", lambda *args: replaced.append(args) or original_replace(*args)
+    )
+    data_manager.save_schedule_with_statistics("2025-01", dict(schedule))
+    data_manager.save_data()
+
+    assert replaced == []
+    assert data_manager.data["statistics"]["2025-01"]["generated_at"] == generated_at
+
+    data_manager.set_shift_assignment("2025-01", "2025-01-02", "day_shift", alice.id)
+    data_manager.save_data()
+    assert len(replaced) == 1
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_round_trip_with_and_without_orjson(tmp_path, monkeypatch, use_orjson):
+    """
+    Why this is important: orjson is an optional speedup. Files written with
+    either encoder must load with either decoder and keep the same data.
+    """
+    from shift_scheduler import data_manager as dm_module
+
+    if not use_orjson:
+        monkeypatch.setattr(dm_module, "orjson", None)
+
+    data_file = tmp_path / "data.json"
+    dm = DataManager(str(data_file))
+    alice = dm.add_employee("Alice", "High")
+    dm.set_shift_assignment("2025-01", "2025-01-01", "day_shift", alice.id)
+    dm.save_data()
+
+    monkeypatch.undo()
+    reloaded = DataManager(str(data_file))
+    assert reloaded.data == json.loads(data_file.read_text(encoding="utf-8"))
+    assert reloaded.get_shift_assignment("2025-01", "2025-01-01", "day_shift") == (
+        alice.id
+    )
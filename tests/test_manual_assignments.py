@@ -59,6 +59,70 @@ def test_set_manual_assignment(data_manager):
     assert reloaded.is_manual_assignment(month_key, date_str, "day_shift")
 
 
+def test_schedule_reflects_assignments(data_manager):
+    """Tests that get_schedule reflects every schedule write in dict format."""
+    month_key = "2025-01"
+    date_str = "2025-01-01"
+    emp1 = data_manager.get_employee_by_name("TestHigh")
+    emp2 = data_manager.get_employee_by_name("TestLow")
+
+    assert data_manager.get_schedule(month_key) == {}
+
+    data_manager.set_shift_assignment(month_key, date_str, "day_shift", emp1.id)
+    schedule = data_manager.get_schedule(month_key)
+    assert schedule[date_str]["day_shift"]["employee_id"] == emp1.id
+    assert data_manager.get_schedule(month_key) is schedule
+
+    data_manager.save_schedule(
+        month_key, {date_str: {"day_shift": emp2.id, "night_shift": None}}
+    )
+    assert data_manager.get_shift_assignment(month_key, date_str, "day_shift") == (
+        emp2.id
+    )
+
+
+def test_incremental_shift_index_matches_full_rebuild(data_manager):
+    """Tests that single-cell edits keep the maintained shift index exact."""
+    month_key = "2025-01"
+    emp1 = data_manager.get_employee_by_name("TestHigh")
+    emp2 = data_manager.get_employee_by_name("TestLow")
+
+    data_manager.set_shift_assignment(month_key, "2025-01-01", "day_shift", emp1.id)
+    stats = data_manager.calculate_employee_stats(month_key)
+    assert stats["TestHigh"]["day_shifts"] == 1
+
+    # Edits after the index was built are applied incrementally
+    data_manager.set_shift_assignment(
+        month_key, "2025-01-01", "day_shift", emp2.id, is_manual=True
+    )
+    data_manager.set_shift_assignment(month_key, "2025-01-02", "night_shift", emp1.id)
+    data_manager.set_shift_assignment(month_key, "2025-01-03", "day_shift", emp2.id)
+    data_manager.set_shift_assignment(month_key, "2025-01-03", "day_shift", None)
+
+    incremental = data_manager.calculate_employee_stats(month_key)
+    team_stats = data_manager.get_team_stats(month_key, incremental)
+    data_manager._shift_index.clear()
+    assert data_manager.calculate_employee_stats(month_key) == incremental
+    assert incremental["TestHigh"]["night_shifts"] == 1
+    assert incremental["TestLow"]["day_shifts"] == 1
+    assert team_stats["manual_assignments"] == 1
+
+
+def test_old_format_schedule_normalized_on_load(tmp_path):
+    """Tests that schedules stored as bare employee IDs are upgraded on load."""
+    data_file = tmp_path / "old_schedule.json"
+    data_file.write_text(
+        json.dumps({"schedules": {"2025-01": {"2025-01-01": {"day_shift": 1}}}})
+    )
+
+    dm = DataManager(str(data_file))
+    day_data = dm.get_schedule("2025-01")["2025-01-01"]
+
+    assert day_data["day_shift"] == {"employee_id": 1, "is_manual": False}
+    assert day_data["night_shift"] is None
+    assert dm.get_shift_assignment("2025-01", "2025-01-01", "day_shift") == 1
+
+
 def test_partial_generation_respects_manual(scheduler):
     """Tests that partial generation does not overwrite existing manual assignments."""
     month_key = "2025-08"
@@ -11,7 +11,7 @@ import calendar  # Import the calendar module
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from shift_scheduler.data_manager import DataManager
-from shift_scheduler.scheduler_logic import ShiftScheduler
+from shift_scheduler.scheduler_logic import ScheduleMethod, ShiftScheduler
 
 
 @pytest.fixture
@@ -74,6 +74,8 @@ def test_partial_generation_for_current_month(scheduler, data_manager):
 
     # Assertions
     assert result.success, f"Partial generation failed: {result.message}"
+    # Partial messages never mention the solver, so the method is set explicitly
+    assert result.method is ScheduleMethod.CP_SAT
 
     schedule = data_manager.get_schedule(month_key)
 
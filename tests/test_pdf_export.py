@@ -4,12 +4,13 @@ from pathlib import Path
 import tempfile
 import os
 import json
+from dataclasses import replace
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from shift_scheduler.data_manager import DataManager
-from shift_scheduler.reporting import ExportManager
+from shift_scheduler.reporting import ExportManager, _CalendarCell
 
 
 @pytest.fixture
@@ -74,6 +75,27 @@ def test_pdf_export_bad_path(export_manager):
     assert result is False
 
 
+def test_calendar_cells_keep_bold_day_number(export_manager, data_manager):
+    """
+    Why this is important: Calendar cells are drawn directly instead of as
+    Paragraphs for speed, but must still show the bold day number, and names
+    too long for the cell must still wrap.
+    """
+    generator = export_manager.report_generator
+    alice = data_manager.get_employee_by_name("Alice")
+    schedule = {"2025-08-01": {"day_shift": alice.id, "night_shift": None}}
+
+    cell = generator._format_calendar_cell(2025, 8, 1, schedule, {alice.id: alice})
+    assert isinstance(cell, _CalendarCell)
+    assert cell.lines == ["1", "Day: ★Alice", "Night: ---"]
+
+    long_name = replace(alice, name="Alexandra Bartholomew-Richardson & Co")
+    cell = generator._format_calendar_cell(2025, 8, 1, schedule, {alice.id: long_name})
+    assert not isinstance(cell, _CalendarCell)
+    assert cell.text.startswith("<b>1</b>")
+    assert "&amp; Co" in cell.text
+
+
 def test_excel_export_basic(export_manager):
     """
     Why this is important: Ensures the Excel export functionality works
@@ -104,3 +126,93 @@ def test_csv_export_basic(export_manager):
     assert os.path.exists(output_path)
     assert os.path.getsize(output_path) > 0
     os.unlink(output_path)
+
+
+def test_report_statistics_follow_data_changes(export_manager, data_manager):
+    """
+    Why this is important: Report statistics and the dashboard summary are
+    cached between exports of the same month, so any schedule edit must make
+    the next export recalculate them instead of reusing stale numbers.
+    """
+    generator = export_manager.report_generator
+    emp_stats, _ = generator._get_stats("2025-08")
+    assert generator._get_stats("2025-08")[0] is emp_stats
+    assert emp_stats["Alice"]["total_shifts"] == 1
+    summary = generator.create_dashboard_summary(2025, 8)
+    assert generator.create_dashboard_summary(2025, 8) is summary
+    assert "• Total Shifts: 1" in summary
+
+    alice = data_manager.get_employee_by_name("Alice")
+    data_manager.set_shift_assignment("2025-08", "2025-08-02", "night_shift", alice.id)
+
+    emp_stats, team_stats = generator._get_stats("2025-08")
+    # Night shifts count as two units
+    assert emp_stats["Alice"]["total_shifts"] == 3
+    assert team_stats["total_shifts_assigned"] == 3
+    assert "• Total Shifts: 3" in generator.create_dashboard_summary(2025, 8)
+
+
+def test_batch_export_shares_one_timestamp(export_manager, tmp_path):
+    """
+    Why this is important: Files produced by one batch export belong together,
+    so they must carry the same timestamp suffix and differ only by extension.
+    """
+    results = export_manager.batch_export(2025, 8, str(tmp_path), ["csv", "pdf"])
+    assert results == {"csv": True, "pdf": True}
+
+    stems = {path.stem for path in tmp_path.iterdir()}
+    assert len(stems) == 1
+    assert stems.pop().startswith("shift_schedule_august_2025_")
+
+
+def test_batch_export_recreates_removed_directory(export_manager, tmp_path):
+    """
+    Why this is important: An output directory deleted between batches must
+    not make the next export fail; every batch creates it again if needed.
+    """
+    output_dir = tmp_path / "exports"
+    assert export_manager.batch_export(2025, 8, str(output_dir), ["csv"]) == {
+        "csv": True
+    }
+
+    for path in output_dir.iterdir():
+        path.unlink()
+    output_dir.rmdir()
+
+    for _ in range(2):
+        assert export_manager.batch_export(2025, 8, str(output_dir), ["csv"]) == {
+            "csv": True
+        }
+
+
+def test_batch_export_rejects_unknown_formats(export_manager, tmp_path):
+    """
+    Why this is important: A typo in the format list should fail before any
+    directory is created or any file is written, not halfway through a batch.
+    """
+    output_dir = tmp_path / "exports"
+    with pytest.raises(ValueError, match="docx"):
+        export_manager.batch_export(2025, 8, str(output_dir), ["CSV", "docx"])
+    assert not output_dir.exists()
+
+    assert export_manager.batch_export(2025, 8, str(output_dir), ["CSV"]) == {
+        "csv": True
+    }
+
+
+def test_batch_export_gathers_data_once(export_manager, tmp_path, monkeypatch):
+    """
+    Why this is important: Every format of a batch shows the same schedule,
+    so the employee snapshot and statistics should be gathered once and
+    shared instead of rebuilt by each exporter.
+    """
+    generator = export_manager.report_generator
+    calls = []
+    original = generator._get_employee_map
+    monkeypatch.setattr(
+        generator, "_get_employee_map", lambda: calls.append(1) or original()
+    )
+
+    results = export_manager.batch_export(2025, 8, str(tmp_path), ["pdf", "csv"])
+    assert results == {"pdf": True, "csv": True}
+    assert calls == [1]
@@ -17,7 +17,7 @@ import json
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from shift_scheduler.data_manager import DataManager, Employee
-from shift_scheduler.scheduler_logic import ShiftScheduler, ConstraintViolation
+from shift_scheduler.scheduler_logic import _DAY, ShiftScheduler, ConstraintViolation
 
 
 @pytest.fixture
@@ -119,6 +119,86 @@ def test_schedule_generation_and_statistics(scheduler):
     assert hasattr(result, "statistics")
 
 
+def test_schedule_generation_with_pinned_workers(data_manager):
+    """A single pinned worker still solves; the default uses a full portfolio."""
+    assert ShiftScheduler(data_manager).num_workers >= 8
+    scheduler = ShiftScheduler(data_manager, num_workers=1)
+    result = scheduler.generate_schedule(2024, 2, allow_quota_violations=True)
+    assert result.success and len(result.schedule) == 29
+
+
+def test_warm_start_respects_new_absence(scheduler, data_manager):
+    """Warm-start hints from a prior schedule must not override a new absence."""
+    first = scheduler.generate_schedule(2024, 2, allow_quota_violations=True)
+    assert first.success
+    emp_id = first.schedule["2024-02-03"]["day_shift"]["employee_id"]
+    data_manager.add_absence(emp_id, "2024-02-03")
+
+    result = scheduler.generate_schedule(
+        2024, 2, allow_quota_violations=True, warm_start=True
+    )
+    assert result.success
+    assert result.schedule["2024-02-03"]["day_shift"]["employee_id"] != emp_id
+
+
+def test_acceptable_objective_stops_search_early(data_manager, monkeypatch):
+    """Any solution within the acceptable quota penalty ends the search."""
+    from shift_scheduler import scheduler_logic
+
+    stops = []
+    callback_cls = scheduler_logic._ObjectiveThresholdCallback
+    original_stop = callback_cls.StopSearch
+    monkeypatch.setattr(
+        callback_cls, "StopSearch", lambda self: stops.append(1) or original_stop(self)
+    )
+
+    # A single worker keeps the search deterministic
+    scheduler = ShiftScheduler(data_manager, num_workers=1)
+    scheduler.acceptable_objective = -1  # never acceptable
+    assert scheduler.generate_schedule(2024, 2, allow_quota_violations=True).success
+    assert stops == []
+
+    scheduler.acceptable_objective = float("inf")
+    result = scheduler.generate_schedule(2024, 2, allow_quota_violations=True)
+    assert result.success and len(result.schedule) == 29
+    assert stops == [1]
+
+
+def test_model_reused_until_inputs_change(scheduler, data_manager):
+    """Re-solving a month reuses the built model until an input changes."""
+    model, _ = scheduler._create_cp_sat_model(2024, 2, True)
+    assert scheduler._create_cp_sat_model(2024, 2, True, warm_start=True)[0] is model
+
+    alice = data_manager.get_employee_by_name("Alice")
+    data_manager.add_absence(alice.id, "2024-02-10")
+    assert scheduler._create_cp_sat_model(2024, 2, True)[0] is not model
+
+
+def test_month_caches_reloaded_only_on_change(scheduler, data_manager, monkeypatch):
+    """Month caches are built once per month and data revision."""
+    calls = []
+    original = data_manager.iter_employees
+    monkeypatch.setattr(
+        data_manager,
+        "iter_employees",
+        lambda *a, **k: calls.append(1) or original(*a, **k),
+    )
+    scheduler._initialize_for_month(2024, 2)
+    scheduler._initialize_for_month(2024, 2)
+    loads = len(calls)
+    assert loads > 0
+
+    alice = data_manager.get_employee_by_name("Alice")
+    data_manager.add_absence(alice.id, "2024-02-10")
+    scheduler._initialize_for_month(2024, 2)
+    assert len(calls) == 2 * loads
+    assert not scheduler._is_employee_eligible_for_shift(alice.id, 10, _DAY)
+
+    scheduler.invalidate_caches()
+    scheduler._initialize_for_month(2024, 2)
+    assert len(calls) == 3 * loads
+
+
 def test_experience_based_allocation_with_emergency(scheduler):
     """High experience employees get more shifts during emergencies."""
     result = scheduler.generate_schedule(